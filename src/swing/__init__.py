@@ -0,0 +1,27 @@
+"""Swing trading screener for Indian and US stock markets."""
+
+import logging
+import sys
+
+
+def _configure_logging() -> None:
+    """Attach the screener's stderr handler to the ``swing`` logger, once.
+
+    Module loggers (``swing.data.fetcher`` …) propagate to it, so they need no
+    handlers of their own. Third-party loggers are left at their defaults.
+    """
+    logger = logging.getLogger(__name__)
+    if logger.handlers:
+        return  # already configured, e.g. on reload
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s │ %(levelname)-7s │ %(name)s │ %(message)s",
+            datefmt="%H:%M:%S",
+        )
+    )
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+
+_configure_logging()
@@ -0,0 +1,20 @@
+"""Optional Numba JIT support for the analysis hot loops.
+
+``njit`` is re-exported from numba when it is installed. Without numba it
+degrades to a no-op decorator, so the same kernels run as plain Python.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover — exercised only without numba
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
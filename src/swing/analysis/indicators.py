@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import functools
+
+import numpy as np
 import pandas as pd
-from ta.momentum import RSIIndicator
-from ta.trend import EMAIndicator, MACD
-from ta.volatility import AverageTrueRange
+from numpy.lib.stride_tricks import sliding_window_view
 
+from swing.analysis._njit import njit
 from swing.config import (
     ATR_PERIOD,
     EMA_LONG,
@@ -24,89 +26,274 @@ def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
     """Add all technical indicator columns to the OHLCV DataFrame.
 
     Input must have columns: Open, High, Low, Close, Volume
-    Returns the DataFrame with added indicator columns.
+    Returns a new DataFrame with the indicator columns added; the input
+    is left unchanged.
     """
-    df = df.copy()
-
-    # ── EMAs ──
-    df["EMA_20"] = EMAIndicator(close=df["Close"], window=EMA_SHORT).ema_indicator()
-    df["EMA_50"] = EMAIndicator(close=df["Close"], window=EMA_MID).ema_indicator()
-    df["EMA_200"] = EMAIndicator(close=df["Close"], window=EMA_LONG).ema_indicator()
-
-    # ── RSI ──
-    df["RSI"] = RSIIndicator(close=df["Close"], window=RSI_PERIOD).rsi()
-
-    # ── MACD ──
-    macd = MACD(
-        close=df["Close"],
-        window_slow=MACD_SLOW,
-        window_fast=MACD_FAST,
-        window_sign=MACD_SIGNAL,
+    ema_s, ema_m, ema_l, rsi, macd, macd_signal, macd_hist, atr = _indicators_nb(
+        df["High"].to_numpy(dtype=np.float64),
+        df["Low"].to_numpy(dtype=np.float64),
+        df["Close"].to_numpy(dtype=np.float64),
+        EMA_SHORT,
+        EMA_MID,
+        EMA_LONG,
+        RSI_PERIOD,
+        MACD_FAST,
+        MACD_SLOW,
+        MACD_SIGNAL,
+        ATR_PERIOD,
+    )
+
+    # Build all indicator columns at once and join in a single allocation
+    indicators = pd.DataFrame(
+        {
+            # ── EMAs ──
+            "EMA_20": ema_s,
+            "EMA_50": ema_m,
+            "EMA_200": ema_l,
+            # ── RSI ──
+            "RSI": rsi,
+            # ── MACD ──
+            "MACD": macd,
+            "MACD_Signal": macd_signal,
+            "MACD_Hist": macd_hist,
+            # ── ATR ──
+            "ATR": atr,
+            # ── Volume SMA ──
+            "Volume_SMA": _sma(df["Volume"].to_numpy(dtype=np.float64), VOLUME_SMA_PERIOD),
+        },
+        index=df.index,
     )
-    df["MACD"] = macd.macd()
-    df["MACD_Signal"] = macd.macd_signal()
-    df["MACD_Hist"] = macd.macd_diff()
+    return df.join(indicators)
+
+
+def _sma(values: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average via a cumulative sum, matching ``rolling(window).mean()``.
+
+    A window is NaN unless all of its `window` bars are valid. Missing bars
+    are summed as zero and counted separately, so one NaN only blanks the
+    windows that contain it instead of every later bar.
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        missing = np.isnan(values)
+        csum = np.cumsum(np.concatenate(([0.0], np.where(missing, 0.0, values))))
+        cmiss = np.cumsum(np.concatenate(([0], missing)))
+        full = (cmiss[window:] - cmiss[:-window]) == 0
+        out[window - 1 :] = np.where(full, (csum[window:] - csum[:-window]) / window, np.nan)
+    return out
+
+
+@njit(cache=True)
+def _indicators_nb(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    ema_short: int,
+    ema_mid: int,
+    ema_long: int,
+    rsi_period: int,
+    macd_fast: int,
+    macd_slow: int,
+    macd_signal: int,
+    atr_period: int,
+) -> tuple[np.ndarray, ...]:
+    """Compute EMA/RSI/MACD/ATR recurrences in a single pass over the bars.
+
+    Warm-up bars are NaN, matching pandas ``ewm(min_periods=window)``:
+    EMAs and RSI use Wilder/exponential smoothing seeded at bar 0, the MACD
+    signal line is seeded at the first complete MACD value, and ATR is
+    seeded with the simple mean of the first ``atr_period`` true ranges.
+
+    Returns (ema_short, ema_mid, ema_long, rsi, macd, macd_signal,
+    macd_hist, atr) as float64 arrays.
+    """
+    n = close.shape[0]
+    ema_s_out = np.full(n, np.nan)
+    ema_m_out = np.full(n, np.nan)
+    ema_l_out = np.full(n, np.nan)
+    rsi_out = np.full(n, np.nan)
+    macd_out = np.full(n, np.nan)
+    signal_out = np.full(n, np.nan)
+    hist_out = np.full(n, np.nan)
+    atr_out = np.full(n, np.nan)
+    if n == 0:
+        return ema_s_out, ema_m_out, ema_l_out, rsi_out, macd_out, signal_out, hist_out, atr_out
+
+    a_s = 2.0 / (ema_short + 1)
+    a_m = 2.0 / (ema_mid + 1)
+    a_l = 2.0 / (ema_long + 1)
+    a_fast = 2.0 / (macd_fast + 1)
+    a_slow = 2.0 / (macd_slow + 1)
+    a_sig = 2.0 / (macd_signal + 1)
+    a_rsi = 1.0 / rsi_period
+    a_atr = 1.0 / atr_period
+
+    ema_s = ema_m = ema_l = ema_fast = ema_slow = close[0]
+    avg_up = 0.0
+    avg_down = 0.0
+    signal = 0.0
+    tr_sum = 0.0
+    atr = 0.0
+
+    for i in range(n):
+        c = close[i]
+
+        if i == 0:
+            tr = high[0] - low[0]
+        else:
+            ema_s = (1.0 - a_s) * ema_s + a_s * c
+            ema_m = (1.0 - a_m) * ema_m + a_m * c
+            ema_l = (1.0 - a_l) * ema_l + a_l * c
+            ema_fast = (1.0 - a_fast) * ema_fast + a_fast * c
+            ema_slow = (1.0 - a_slow) * ema_slow + a_slow * c
+
+            prev_close = close[i - 1]
+            delta = c - prev_close
+            up = delta if delta > 0.0 else 0.0
+            down = -delta if delta < 0.0 else 0.0
+            avg_up = (1.0 - a_rsi) * avg_up + a_rsi * up
+            avg_down = (1.0 - a_rsi) * avg_down + a_rsi * down
+
+            tr = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+
+        # ── EMAs ──
+        if i >= ema_short - 1:
+            ema_s_out[i] = ema_s
+        if i >= ema_mid - 1:
+            ema_m_out[i] = ema_m
+        if i >= ema_long - 1:
+            ema_l_out[i] = ema_l
 
-    # ── ATR ──
-    df["ATR"] = AverageTrueRange(
-        high=df["High"], low=df["Low"], close=df["Close"], window=ATR_PERIOD
-    ).average_true_range()
+        # ── RSI ──
+        if i >= rsi_period - 1:
+            if avg_down == 0.0:
+                rsi_out[i] = 100.0
+            else:
+                rsi_out[i] = 100.0 - 100.0 / (1.0 + avg_up / avg_down)
 
-    # ── Volume SMA ──
-    df["Volume_SMA"] = df["Volume"].rolling(window=VOLUME_SMA_PERIOD).mean()
+        # ── MACD ──
+        if i >= macd_slow - 1:
+            macd = ema_fast - ema_slow
+            if i == macd_slow - 1:
+                signal = macd
+            else:
+                signal = (1.0 - a_sig) * signal + a_sig * macd
+            macd_out[i] = macd
+            if i >= macd_slow + macd_signal - 2:
+                signal_out[i] = signal
+                hist_out[i] = macd - signal
 
-    return df
+        # ── ATR ──
+        if i < atr_period:
+            tr_sum += tr
+            if i == atr_period - 1:
+                atr = tr_sum / atr_period
+                atr_out[i] = atr
+        else:
+            atr = (1.0 - a_atr) * atr + a_atr * tr
+            atr_out[i] = atr
+
+    return ema_s_out, ema_m_out, ema_l_out, rsi_out, macd_out, signal_out, hist_out, atr_out
+
+
+def prep_arrays(df: pd.DataFrame, columns: list[str]) -> np.ndarray:
+    """Extract columns once as a (len(columns), len(df)) float64 array.
+
+    Each row is a contiguous per-column series, so ``arr[i]`` can be handed
+    straight to NumPy/Numba routines and ``arr[:, -1]`` is the latest bar.
+    """
+    return np.ascontiguousarray(df[columns].to_numpy(dtype=np.float64).T)
 
 
 def find_support_resistance(
-    df: pd.DataFrame, lookback: int = 60, tolerance: float = 0.015
+    highs: np.ndarray, lows: np.ndarray, lookback: int = 60, tolerance: float = 0.015
 ) -> tuple[list[float], list[float]]:
     """Find support and resistance levels from swing highs/lows.
 
-    Uses a rolling window to detect local minima (supports) and
+    Takes the full High/Low series as arrays and uses the last `lookback`
+    bars. Uses a rolling window to detect local minima (supports) and
     local maxima (resistances). Clusters nearby levels.
 
     Returns (supports, resistances) as sorted lists of price levels.
     """
-    if len(df) < lookback:
-        lookback = max(20, len(df) - 5)
+    if len(lows) < lookback:
+        lookback = max(20, len(lows) - 5)
 
-    recent = df.tail(lookback)
-    highs = recent["High"].values
-    lows = recent["Low"].values
+    highs = np.ascontiguousarray(highs[-lookback:], dtype=np.float64)
+    lows = np.ascontiguousarray(lows[-lookback:], dtype=np.float64)
 
-    window = 5  # bars on each side to qualify as swing point
+    supports, resistances = _support_resistance_cached(highs.tobytes(), lows.tobytes(), tolerance)
+    return list(supports), list(resistances)
+
+
+@functools.lru_cache(maxsize=4096)
+def _support_resistance_cached(
+    highs_bytes: bytes, lows_bytes: bytes, tolerance: float
+) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Memoized core of find_support_resistance(), keyed by the raw window bytes.
+
+    Repeat scans of the same day's data (same bars → same bytes) skip the
+    computation. Returns tuples so cached results can't be mutated by callers.
+    """
+    highs = np.frombuffer(highs_bytes, dtype=np.float64)
+    lows = np.frombuffer(lows_bytes, dtype=np.float64)
 
-    supports_raw: list[float] = []
-    resistances_raw: list[float] = []
+    window = 5  # bars on each side to qualify as swing point
 
-    for i in range(window, len(lows) - window):
-        # Swing low → support
-        if lows[i] == min(lows[i - window : i + window + 1]):
-            supports_raw.append(float(lows[i]))
-        # Swing high → resistance
-        if highs[i] == max(highs[i - window : i + window + 1]):
-            resistances_raw.append(float(highs[i]))
+    supports_raw = _swing_points(lows, window, np.min)  # swing lows → support
+    resistances_raw = _swing_points(highs, window, np.max)  # swing highs → resistance
 
     # Cluster nearby levels
     supports = _cluster_levels(supports_raw, tolerance)
     resistances = _cluster_levels(resistances_raw, tolerance)
 
-    return sorted(supports), sorted(resistances)
+    return tuple(sorted(supports)), tuple(sorted(resistances))
+
+
+def _swing_points(values: np.ndarray, window: int, reducer) -> list[float]:
+    """Return the bars that equal the reducer (min/max) of their ±window neighbourhood.
+
+    Only interior bars with a full window on both sides are considered.
+    """
+    span = 2 * window + 1
+    if len(values) < span:
+        return []
+    inner = values[window : len(values) - window]
+    extremes = reducer(sliding_window_view(values, span), axis=1)
+    return inner[inner == extremes].astype(float).tolist()
 
 
 def _cluster_levels(levels: list[float], tolerance: float) -> list[float]:
     """Merge nearby price levels within tolerance %."""
     if not levels:
         return []
+    return _cluster_levels_nb(np.sort(np.asarray(levels, dtype=np.float64)), tolerance).tolist()
+
 
-    levels = sorted(levels)
-    clusters: list[list[float]] = [[levels[0]]]
+@njit(cache=True)
+def _cluster_levels_nb(levels: np.ndarray, tolerance: float) -> np.ndarray:
+    """Single-pass clustering over sorted levels; returns each cluster's mean.
+
+    A level joins the current cluster when it is within tolerance % of the
+    previous level, otherwise it starts a new one.
+    """
+    out = np.empty(levels.shape[0])
+    n_out = 0
+    cluster_sum = levels[0]
+    cluster_count = 1
+    last = levels[0]
 
-    for lvl in levels[1:]:
-        if abs(lvl - clusters[-1][-1]) / clusters[-1][-1] <= tolerance:
-            clusters[-1].append(lvl)
+    for i in range(1, levels.shape[0]):
+        lvl = levels[i]
+        if abs(lvl - last) / last <= tolerance:
+            cluster_sum += lvl
+            cluster_count += 1
         else:
-            clusters.append([lvl])
+            out[n_out] = cluster_sum / cluster_count
+            n_out += 1
+            cluster_sum = lvl
+            cluster_count = 1
+        last = lvl
 
-    return [sum(c) / len(c) for c in clusters]
+    out[n_out] = cluster_sum / cluster_count
+    return out[: n_out + 1]
@@ -0,0 +1,131 @@
+"""Per-ticker analysis pipeline: indicators → signals → levels → score."""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+from swing.analysis._njit import HAVE_NUMBA
+from swing.analysis.levels import compute_levels
+from swing.analysis.scorer import compute_score
+from swing.analysis.signals import detect_signals
+from swing.config import ANALYSIS_CHUNKSIZE, ANALYSIS_WORKERS, MIN_PRICE
+
+
+def analyze_one(
+    ticker: str,
+    df: pd.DataFrame,
+    min_price: float = MIN_PRICE,
+    min_bars: int = 50,
+) -> dict:
+    """Run the full analysis for one ticker's OHLCV data.
+
+    Returns a plain dict (cheap to pickle back from a worker process) with:
+        - ticker: str
+        - candidate: bool — whether the stock qualifies as a swing trade
+        - reason: str — why it was rejected (insufficient_data,
+          filter_failed, weak_signals, risk_reward); only when not a candidate
+        - score, score_breakdown, signals, signal_count, latest, levels,
+          supports, resistances, sparkline — only for candidates
+    """
+    # Malformed frames (too short, no usable last close) are rejected before any analysis
+    if (
+        df is None
+        or len(df) < max(min_bars, 1)
+        or "Close" not in df.columns
+        or not np.isfinite(df["Close"].iat[-1])
+    ):
+        return {"ticker": ticker, "candidate": False, "reason": "insufficient_data"}
+
+    # detect_signals applies the cheap price/volume filters before computing indicators
+    result = detect_signals(df, min_price=min_price)
+
+    # Every detect_signals() result carries "passed", and passing ones carry all fields
+    if not result["passed"]:
+        return {
+            "ticker": ticker,
+            "candidate": False,
+            "reason": result.get("reason", "weak_signals"),
+        }
+
+    levels = compute_levels(result)
+    if levels is None:
+        return {"ticker": ticker, "candidate": False, "reason": "risk_reward"}
+
+    score_result = compute_score(result, levels)
+
+    # Sparkline data (last 30 closes), rounded in one vectorised step; slice the
+    # float32 column before upcasting so only those 30 values are converted
+    sparkline = np.round(df["Close"].to_numpy()[-30:].astype(np.float64), 2).tolist()
+
+    return {
+        "ticker": ticker,
+        "candidate": True,
+        "score": score_result["total"],
+        "score_breakdown": score_result["factors"],
+        "signals": result["signals"],
+        "signal_count": result["signal_count"],
+        "latest": result["latest"],
+        "levels": levels,
+        "supports": result["supports"],
+        "resistances": result["resistances"],
+        "sparkline": sparkline,
+    }
+
+
+def warm_up() -> None:
+    """Run analyze_one() once on synthetic bars.
+
+    Compiles the Numba kernels (or loads them from Numba's on-disk cache)
+    in the calling process, so its first real ticker is not slowed by that
+    one-off work. Without numba there is nothing to compile, and importing
+    this module has already loaded the analysis modules.
+    """
+    if not HAVE_NUMBA:
+        return
+    close = 100 + 10 * np.sin(np.arange(260) / 5)  # oscillates, so swing points exist
+    df = pd.DataFrame(
+        {"Open": close, "High": close + 1, "Low": close - 1, "Close": close, "Volume": 1e7},
+        dtype=np.float32,
+    )
+    analyze_one("WARMUP", df, min_price=0, min_bars=1)
+
+
+def analyze_batch(
+    frames: dict[str, pd.DataFrame],
+    min_price: float = MIN_PRICE,
+    min_bars: int = 50,
+    progress_callback=None,
+    max_workers: int | None = ANALYSIS_WORKERS,
+    executor: Executor | None = None,
+) -> list[dict]:
+    """Run analyze_one() for every ticker across a pool of worker processes.
+
+    The work is CPU-bound pandas/NumPy code, so separate processes sidestep
+    the GIL. Results come back in the same order as ``frames``;
+    ``progress_callback(i, total, ticker)`` is invoked as each one arrives.
+    Pass a long-lived ``executor`` to reuse warm workers across calls;
+    otherwise a pool of ``max_workers`` processes is started for this batch.
+    """
+    tickers = list(frames)
+    total = len(tickers)
+
+    def _collect(outcomes) -> list[dict]:
+        results: list[dict] = []
+        for i, outcome in enumerate(outcomes, 1):
+            results.append(outcome)
+            if progress_callback:
+                progress_callback(i, total, outcome["ticker"])
+        return results
+
+    args = (tickers, frames.values(), repeat(min_price), repeat(min_bars))
+    if executor is not None:
+        return _collect(executor.map(analyze_one, *args, chunksize=ANALYSIS_CHUNKSIZE))
+    if total < 2 or max_workers == 1:
+        return _collect(map(analyze_one, *args))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return _collect(executor.map(analyze_one, *args, chunksize=ANALYSIS_CHUNKSIZE))
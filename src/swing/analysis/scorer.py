@@ -2,8 +2,20 @@
 
 from __future__ import annotations
 
+import numpy as np
+
 from swing.config import MIN_RISK_REWARD, SCORE_WEIGHTS, VOLUME_SURGE_FACTOR
 
+# Factor order shared by the weights vector and the breakdown shown in the UI
+_FACTORS = (
+    ("signals", "Signal Count"),
+    ("risk_reward", "Risk / Reward"),
+    ("volume", "Volume"),
+    ("trend", "Trend Strength"),
+    ("rsi", "RSI Position"),
+)
+_WEIGHTS = np.array([SCORE_WEIGHTS[key] for key, _ in _FACTORS], dtype=np.float64)
+
 
 def compute_score(signal_result: dict, levels: dict) -> dict:
     """Compute a 0–100 Swing Score with full explainable breakdown.
@@ -80,46 +92,23 @@ def compute_score(signal_result: dict, levels: dict) -> dict:
             rsi_reason = f"RSI {rsi:.0f} — overbought territory"
 
     # ── Weighted composite ──
+    raw_scores = (signal_score, rr_score, vol_score, trend_score, rsi_score)
+    reasons = (signal_reason, rr_reason, vol_reason, trend_reason, rsi_reason)
+    # Each factor is rounded before summing so the total matches the breakdown
+    weighted = [round(w, 1) for w in (np.array(raw_scores, dtype=np.float64) * _WEIGHTS).tolist()]
+    total = round(min(100, max(0, sum(weighted))), 1)
+
     factors = [
         {
-            "name": "Signal Count",
-            "raw_score": round(signal_score, 1),
-            "weight": SCORE_WEIGHTS["signals"],
-            "weighted": round(signal_score * SCORE_WEIGHTS["signals"], 1),
-            "reason": signal_reason,
-        },
-        {
-            "name": "Risk / Reward",
-            "raw_score": round(rr_score, 1),
-            "weight": SCORE_WEIGHTS["risk_reward"],
-            "weighted": round(rr_score * SCORE_WEIGHTS["risk_reward"], 1),
-            "reason": rr_reason,
-        },
-        {
-            "name": "Volume",
-            "raw_score": round(vol_score, 1),
-            "weight": SCORE_WEIGHTS["volume"],
-            "weighted": round(vol_score * SCORE_WEIGHTS["volume"], 1),
-            "reason": vol_reason,
-        },
-        {
-            "name": "Trend Strength",
-            "raw_score": round(trend_score, 1),
-            "weight": SCORE_WEIGHTS["trend"],
-            "weighted": round(trend_score * SCORE_WEIGHTS["trend"], 1),
-            "reason": trend_reason,
-        },
-        {
-            "name": "RSI Position",
-            "raw_score": round(rsi_score, 1),
-            "weight": SCORE_WEIGHTS["rsi"],
-            "weighted": round(rsi_score * SCORE_WEIGHTS["rsi"], 1),
-            "reason": rsi_reason,
-        },
+            "name": name,
+            "raw_score": round(raw, 1),
+            "weight": SCORE_WEIGHTS[key],
+            "weighted": w,
+            "reason": reason,
+        }
+        for (key, name), raw, w, reason in zip(_FACTORS, raw_scores, weighted, reasons)
     ]
 
-    total = round(min(100, max(0, sum(f["weighted"] for f in factors))), 1)
-
     return {"total": total, "factors": factors}
 
 
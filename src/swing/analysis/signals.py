@@ -2,30 +2,68 @@
 
 from __future__ import annotations
 
+import bisect
+
+import numpy as np
 import pandas as pd
 
-from swing.analysis.indicators import compute_indicators, find_support_resistance
+from swing.analysis.indicators import compute_indicators, find_support_resistance, prep_arrays
 from swing.config import (
     MIN_AVG_VOLUME,
     MIN_PRICE,
     MIN_SIGNALS_REQUIRED,
     RSI_OVERSOLD,
     SUPPORT_PROXIMITY_PCT,
+    VOLUME_SMA_PERIOD,
     VOLUME_SURGE_FACTOR,
 )
 from swing.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Columns read once per ticker; Close onwards in the order they are unpacked below
+_COLUMNS = [
+    "High",
+    "Low",
+    "Close",
+    "EMA_20",
+    "EMA_50",
+    "EMA_200",
+    "RSI",
+    "MACD",
+    "MACD_Signal",
+    "ATR",
+    "Volume",
+    "Volume_SMA",
+]
+(
+    _IDX_HIGH,
+    _IDX_LOW,
+    _IDX_CLOSE,
+    _IDX_EMA_20,
+    _IDX_EMA_50,
+    _IDX_EMA_200,
+    _IDX_RSI,
+    _IDX_MACD,
+    _IDX_MACD_SIGNAL,
+    _IDX_ATR,
+    _IDX_VOLUME,
+    _IDX_VOLUME_SMA,
+) = range(len(_COLUMNS))
+
 
 def detect_signals(df: pd.DataFrame, min_price: float = MIN_PRICE) -> dict:
-    """Run all signal checks on an indicator-enriched DataFrame.
+    """Run all signal checks on an OHLCV or indicator-enriched DataFrame.
+
+    The price and average-volume filters only need raw Close/Volume, so
+    they run first; indicators are computed only for stocks that pass them.
 
     Returns a dict with:
         - passed: bool — whether the stock qualifies
         - signals: dict[str, bool] — each primary signal status
         - signal_count: int — how many primary signals triggered
-        - filters: dict[str, bool] — each filter status
+        - filters: dict[str, bool | None] — each filter status
+          (None when the check was skipped by an earlier cheap filter)
         - latest: dict — latest row data for context
         - supports: list[float]
         - resistances: list[float]
@@ -33,26 +71,42 @@ def detect_signals(df: pd.DataFrame, min_price: float = MIN_PRICE) -> dict:
     if df is None or len(df) < 50:
         return {"passed": False, "reason": "insufficient_data"}
 
+    # Cheap filters on raw prices first, before any indicator work
+    price_min = bool(df["Close"].iat[-1] >= min_price)
+    volume_min = bool(df["Volume"].tail(VOLUME_SMA_PERIOD).mean() >= MIN_AVG_VOLUME)
+    if not (price_min and volume_min):
+        return {
+            "passed": False,
+            "reason": "filter_failed",
+            "filters": {
+                "price_above_200ema": None,
+                "price_min": price_min,
+                "volume_min": volume_min,
+            },
+        }
+
     # Compute indicators if not already present
     if "EMA_20" not in df.columns:
         df = compute_indicators(df)
 
+    arr = prep_arrays(df, _COLUMNS)
+
     # Find support / resistance
-    supports, resistances = find_support_resistance(df)
+    supports, resistances = find_support_resistance(arr[_IDX_HIGH], arr[_IDX_LOW])
 
-    # Get the last few rows for signal checks
-    latest = df.iloc[-1]
-    prev = df.iloc[-2] if len(df) >= 2 else latest
+    # Get the last few bars for signal checks as plain floats
+    n_bars = arr.shape[1]
+    last = arr[:, -1]
+    prev = arr[:, -2] if n_bars >= 2 else last
+    close, ema_20, ema_50, ema_200, rsi, macd, macd_signal, atr, volume, volume_sma = last[_IDX_CLOSE:]
+    valid = np.isfinite(last)  # one availability check per column, indexed by _IDX_*
+    prev_close = prev[_IDX_CLOSE]
+    prev_rsi = prev[_IDX_RSI]
 
     # ──────────────────────── FILTERS ────────────────────────
-    price_above_200ema = bool(
-        pd.notna(latest.get("EMA_200")) and latest["Close"] > latest["EMA_200"]
-    )
-    price_min = bool(latest["Close"] >= min_price)
-    volume_min = bool(
-        pd.notna(latest.get("Volume_SMA"))
-        and latest["Volume_SMA"] >= MIN_AVG_VOLUME
-    )
+    price_above_200ema = bool(valid[_IDX_EMA_200] and close > ema_200)
+    price_min = bool(close >= min_price)
+    volume_min = bool(valid[_IDX_VOLUME_SMA] and volume_sma >= MIN_AVG_VOLUME)
 
     filters = {
         "price_above_200ema": price_above_200ema,
@@ -71,60 +125,46 @@ def detect_signals(df: pd.DataFrame, min_price: float = MIN_PRICE) -> dict:
 
     # Signal 1: EMA Bullish Alignment (Price > EMA 20 > EMA 50)
     ema_aligned = bool(
-        pd.notna(latest.get("EMA_20"))
-        and pd.notna(latest.get("EMA_50"))
-        and latest["Close"] > latest["EMA_20"] > latest["EMA_50"]
+        valid[_IDX_EMA_20]
+        and valid[_IDX_EMA_50]
+        and close > ema_20 > ema_50
     )
 
     # Signal 2: RSI Oversold Recovery
     # RSI was ≤ RSI_OVERSOLD within last 5 days and is now rising above it
     rsi_recovery = False
-    if pd.notna(latest.get("RSI")):
-        recent_rsi = df["RSI"].iloc[-5:]
-        was_oversold = any(r <= RSI_OVERSOLD for r in recent_rsi.dropna())
-        now_above = latest["RSI"] > RSI_OVERSOLD
-        rsi_rising = latest["RSI"] > prev.get("RSI", 100) if pd.notna(prev.get("RSI")) else False
+    if valid[_IDX_RSI]:
+        recent_rsi = arr[_IDX_RSI, -5:]
+        was_oversold = bool(np.any(recent_rsi <= RSI_OVERSOLD))  # NaN compares False
+        now_above = rsi > RSI_OVERSOLD
+        rsi_rising = rsi > prev_rsi if np.isfinite(prev_rsi) else False
         rsi_recovery = bool(was_oversold and now_above and rsi_rising)
 
     # Signal 3: MACD Bullish Crossover (within last 3 days)
     macd_crossover = False
-    if pd.notna(latest.get("MACD")) and pd.notna(latest.get("MACD_Signal")):
-        for i in range(-3, 0):
-            if abs(i) < len(df) and abs(i) - 1 < len(df):
-                curr = df.iloc[i]
-                prev_row = df.iloc[i - 1]
-                if (
-                    pd.notna(curr.get("MACD"))
-                    and pd.notna(curr.get("MACD_Signal"))
-                    and pd.notna(prev_row.get("MACD"))
-                    and pd.notna(prev_row.get("MACD_Signal"))
-                ):
-                    if (
-                        curr["MACD"] > curr["MACD_Signal"]
-                        and prev_row["MACD"] <= prev_row["MACD_Signal"]
-                    ):
-                        macd_crossover = True
-                        break
+    if valid[_IDX_MACD] and valid[_IDX_MACD_SIGNAL]:
+        # Sign change of MACD − Signal between any adjacent pair of the last 4 bars;
+        # NaN comparisons are False, so warm-up bars never count as a cross
+        spread = arr[_IDX_MACD, -4:] - arr[_IDX_MACD_SIGNAL, -4:]
+        macd_crossover = bool(np.any((spread[:-1] <= 0) & (spread[1:] > 0)))
 
     # Signal 4: Support Bounce
+    # supports is sorted ascending, so the nearest level below close is one bisect away
     support_bounce = False
-    if supports:
-        close = latest["Close"]
-        for sup in reversed(supports):
-            if sup < close:
-                proximity = (close - sup) / sup
-                if proximity <= SUPPORT_PROXIMITY_PCT:
-                    # Check if price is bouncing (today's close > yesterday's close)
-                    if latest["Close"] > prev["Close"]:
-                        support_bounce = True
-                break
+    i = bisect.bisect_left(supports, close) - 1
+    if i >= 0:
+        sup = supports[i]
+        proximity = (close - sup) / sup
+        # Check if price is bouncing (today's close > yesterday's close)
+        if proximity <= SUPPORT_PROXIMITY_PCT and close > prev_close:
+            support_bounce = True
 
     # Signal 5: Volume Surge (requires a green day/positive close)
     volume_surge = bool(
-        pd.notna(latest.get("Volume_SMA"))
-        and latest["Volume_SMA"] > 0
-        and latest["Volume"] >= VOLUME_SURGE_FACTOR * latest["Volume_SMA"]
-        and latest["Close"] > prev["Close"]
+        valid[_IDX_VOLUME_SMA]
+        and volume_sma > 0
+        and volume >= VOLUME_SURGE_FACTOR * volume_sma
+        and close > prev_close
     )
 
     signals = {
@@ -144,16 +184,16 @@ def detect_signals(df: pd.DataFrame, min_price: float = MIN_PRICE) -> dict:
         "signal_count": signal_count,
         "filters": filters,
         "latest": {
-            "close": float(latest["Close"]),
-            "ema_20": float(latest["EMA_20"]) if pd.notna(latest.get("EMA_20")) else None,
-            "ema_50": float(latest["EMA_50"]) if pd.notna(latest.get("EMA_50")) else None,
-            "ema_200": float(latest["EMA_200"]) if pd.notna(latest.get("EMA_200")) else None,
-            "rsi": float(latest["RSI"]) if pd.notna(latest.get("RSI")) else None,
-            "macd": float(latest["MACD"]) if pd.notna(latest.get("MACD")) else None,
-            "macd_signal": float(latest["MACD_Signal"]) if pd.notna(latest.get("MACD_Signal")) else None,
-            "atr": float(latest["ATR"]) if pd.notna(latest.get("ATR")) else None,
-            "volume": float(latest["Volume"]),
-            "volume_sma": float(latest["Volume_SMA"]) if pd.notna(latest.get("Volume_SMA")) else None,
+            "close": float(close),
+            "ema_20": float(ema_20) if valid[_IDX_EMA_20] else None,
+            "ema_50": float(ema_50) if valid[_IDX_EMA_50] else None,
+            "ema_200": float(ema_200) if valid[_IDX_EMA_200] else None,
+            "rsi": float(rsi) if valid[_IDX_RSI] else None,
+            "macd": float(macd) if valid[_IDX_MACD] else None,
+            "macd_signal": float(macd_signal) if valid[_IDX_MACD_SIGNAL] else None,
+            "atr": float(atr) if valid[_IDX_ATR] else None,
+            "volume": float(volume),
+            "volume_sma": float(volume_sma) if valid[_IDX_VOLUME_SMA] else None,
         },
         "supports": supports,
         "resistances": resistances,
@@ -1,5 +1,6 @@
 """Configuration constants for the swing trading screener."""
 
+import os
 from pathlib import Path
 
 # ──────────────────────────── Paths ────────────────────────────
@@ -12,6 +13,8 @@ _PKG_DATA = Path(__file__).resolve().parent / "data"
 _CACHE_DIR = Path("/tmp") / "swing"
 
 DB_PATH = _CACHE_DIR / "cache.db"
+US_LIST_CACHE_DIR = _CACHE_DIR / "us_lists"
+INDEX_LIST_STAMP_DIR = _CACHE_DIR / "index_lists"
 FALLBACK_CSV = _PKG_DATA / "nifty500_fallback.csv"
 NIFTY50_FALLBACK_CSV = _PKG_DATA / "nifty50_fallback.csv"
 NIFTY100_FALLBACK_CSV = _PKG_DATA / "nifty100_fallback.csv"
@@ -33,8 +36,13 @@ NIFTY200_CSV_URL = (
 NIFTY500_CSV_URL = (
     "https://archives.nseindia.com/content/indices/ind_nifty500list.csv"
 )
+# Constituents change quarterly; within this long of the last NSE download the
+# saved fallback CSV is used as-is
+INDEX_LIST_TTL_SECONDS = int(os.environ.get("SWING_INDEX_LIST_TTL_SECONDS", 7 * 86_400))
+US_LIST_TTL_SECONDS = 86_400   # Wikipedia lists are revalidated (ETag) after a day
 HISTORY_PERIOD = "1y"          # download 1 year of daily data
 WARMUP_DAYS = 220              # enough for 200-day EMA warm-up
+OHLCV_MEMO_ENTRIES = 1024      # today's frames kept in memory in front of SQLite
 
 # ──────────────────────────── Indicators ───────────────────────
 EMA_SHORT = 20
@@ -73,6 +81,25 @@ SCORE_WEIGHTS = {
     "rsi": 0.15,
 }
 
+# ──────────────────────────── Concurrency ──────────────────────
+FETCH_WORKERS = 16             # concurrent yfinance downloads in fetch_batch
+ANALYSIS_WORKERS = None        # CLI analysis processes (None = one per CPU core)
+ANALYSIS_CHUNKSIZE = 8         # tickers sent to a worker process per task
+
 # ──────────────────────────── Web ──────────────────────────────
 WEB_HOST = "0.0.0.0"
 WEB_PORT = 8000
+# uvicorn worker processes; each keeps its own in-memory caches and analysis pool,
+# and warm-ups, scan coalescing and stale refreshes are not shared between them
+WEB_WORKERS = int(os.environ.get("SWING_WEB_WORKERS", 1))
+# analysis processes per web worker; 1 analyses in the scan thread, which is
+# about 1–2 s for Nifty 500 and keeps small instances within their memory limit
+WEB_ANALYSIS_WORKERS = int(os.environ.get("SWING_ANALYSIS_WORKERS", 1))
+SCAN_FRESH_SECONDS = 3600      # cached scans younger than this are served as-is
+SCAN_STALE_SECONDS = 86_400    # older ones are served while a refresh runs
+STOCK_LIST_MEMO_SECONDS = 3600 # a loaded stock list is reused in-process this long
+# Markets the server scans at start-up so the first visit hits a warm cache,
+# e.g. SWING_WARMUP_MARKETS=nifty_500,sp_500 (empty = none)
+WARMUP_MARKETS = tuple(
+    m.strip() for m in os.environ.get("SWING_WARMUP_MARKETS", "").split(",") if m.strip()
+)
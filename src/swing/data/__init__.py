@@ -0,0 +1,31 @@
+"""Market data: stock universes, OHLCV downloads and the SQLite cache.
+
+The public helpers below are loaded on first access (PEP 562), so importing
+``swing.data`` does not import yfinance, httpx or pandas up front.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "MARKETS": "universes",
+    "US_MARKETS": "universes",
+    "get_all_universes": "universes",
+    "get_market_stocks": "universes",
+    "fetch_batch": "fetcher",
+    "fetch_ohlcv": "fetcher",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
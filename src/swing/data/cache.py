@@ -2,27 +2,81 @@
 
 from __future__ import annotations
 
+import atexit
+import io
 import json
 import sqlite3
-from datetime import date, datetime
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING
 
-import pandas as pd
-
-from swing.config import DB_PATH
+from swing.config import DB_PATH, OHLCV_MEMO_ENTRIES
 from swing.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 log = get_logger(__name__)
 
+# Serialises writers so concurrent fetch threads don't trip "database is locked".
+_write_lock = threading.Lock()
+
+
+class _ThreadConnection:
+    """One thread's cache connection; closed when the owning thread goes away."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self) -> None:
+        self.conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+    def close(self) -> None:
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+    __del__ = close
+
+
+_tls = threading.local()
+_open_conns: weakref.WeakSet[_ThreadConnection] = weakref.WeakSet()
+
 
 def _get_conn() -> sqlite3.Connection:
-    """Get a connection to the cache database."""
+    """Get this thread's connection to the cache database, opening it on first use."""
+    holder = getattr(_tls, "holder", None)
+    if holder is None:
+        holder = _tls.holder = _ThreadConnection()
+        _open_conns.add(holder)
+    return holder.conn
+
+
+@atexit.register
+def _close_all() -> None:
+    """Close every connection still open at interpreter shutdown."""
+    for holder in list(_open_conns):
+        holder.close()
+
+
+def _init_schema() -> None:
+    """Create the cache tables. Runs once at import."""
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = _get_conn()
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(ohlcv_cache)")}
+    if "data_json" in columns:
+        # Pre-Parquet schema — entries only live a few days, so just rebuild
+        conn.execute("DROP TABLE ohlcv_cache")
     conn.execute("""
         CREATE TABLE IF NOT EXISTS ohlcv_cache (
             ticker TEXT NOT NULL,
             fetch_date TEXT NOT NULL,
-            data_json TEXT NOT NULL,
+            data_blob BLOB NOT NULL,
             PRIMARY KEY (ticker, fetch_date)
         )
     """)
@@ -36,50 +90,154 @@ def _get_conn() -> sqlite3.Connection:
         )
     """)
     conn.commit()
-    return conn
+
+
+_init_schema()
+
+
+def _serialize(df: pd.DataFrame) -> bytes:
+    """Encode an OHLCV DataFrame as zstd-compressed Parquet bytes."""
+    buf = io.BytesIO()
+    df.to_parquet(buf, engine="pyarrow", compression="zstd")
+    return buf.getvalue()
+
+
+def _deserialize(blob: bytes) -> pd.DataFrame:
+    """Decode Parquet bytes written by _serialize()."""
+    import pandas as pd  # deferred: scan-result lookups never need pandas
+
+    return pd.read_parquet(io.BytesIO(blob), engine="pyarrow")
+
+
+# (ticker, fetch_date) -> frame, least recently used first. Scans re-read the
+# same few hundred tickers all day; keeping the decoded frames skips the
+# SQLite read and Parquet decode, and the date in the key retires old days.
+_mem_frames: OrderedDict[tuple[str, str], pd.DataFrame] = OrderedDict()
+_mem_lock = threading.Lock()
+
+
+def _recall(ticker: str, day: str) -> pd.DataFrame | None:
+    """Return the in-memory frame for (ticker, day), marking it recently used."""
+    with _mem_lock:
+        df = _mem_frames.get((ticker, day))
+        if df is not None:
+            _mem_frames.move_to_end((ticker, day))
+        return df
+
+
+def _remember(items: Iterable[tuple[str, pd.DataFrame]], day: str) -> None:
+    """Store frames for day in memory, evicting the least recently used."""
+    with _mem_lock:
+        for ticker, df in items:
+            _mem_frames[(ticker, day)] = df
+            _mem_frames.move_to_end((ticker, day))
+        while len(_mem_frames) > OHLCV_MEMO_ENTRIES:
+            _mem_frames.popitem(last=False)
 
 
 def get_cached_data(ticker: str) -> pd.DataFrame | None:
     """Return cached OHLCV DataFrame for ticker if fetched today, else None."""
     today = date.today().isoformat()
+    df = _recall(ticker, today)
+    if df is not None:
+        return df
     conn = _get_conn()
     try:
         row = conn.execute(
-            "SELECT data_json FROM ohlcv_cache WHERE ticker = ? AND fetch_date = ?",
+            "SELECT data_blob FROM ohlcv_cache WHERE ticker = ? AND fetch_date = ?",
             (ticker, today),
         ).fetchone()
         if row is None:
             return None
-        df = pd.read_json(row[0], orient="split")
-        return df
+        df = _deserialize(row[0])
     except Exception:
         return None
-    finally:
-        conn.close()
+    _remember([(ticker, df)], today)
+    return df
 
 
 def save_to_cache(ticker: str, df: pd.DataFrame) -> None:
     """Save OHLCV DataFrame to cache for today."""
     today = date.today().isoformat()
+    _remember([(ticker, df)], today)
+    data_blob = _serialize(df)
+    with _write_lock:
+        conn = _get_conn()
+        try:
+            conn.execute(
+                """INSERT OR REPLACE INTO ohlcv_cache (ticker, fetch_date, data_blob)
+                   VALUES (?, ?, ?)""",
+                (ticker, today, data_blob),
+            )
+            conn.commit()
+        except Exception as exc:
+            conn.rollback()
+            log.warning("Failed to cache data for %s: %s", ticker, exc)
+
+
+def get_cached_data_many(tickers: list[str]) -> dict[str, pd.DataFrame]:
+    """Return today's cached OHLCV DataFrames for all tickers found, in one query per chunk."""
+    today = date.today().isoformat()
+    found: dict[str, pd.DataFrame] = {}
+    unseen: list[str] = []
+    for ticker in tickers:
+        df = _recall(ticker, today)
+        if df is not None:
+            found[ticker] = df
+        else:
+            unseen.append(ticker)
+    if not unseen:
+        return found
+
     conn = _get_conn()
-    try:
-        data_json = df.to_json(orient="split", date_format="iso")
-        conn.execute(
-            """INSERT OR REPLACE INTO ohlcv_cache (ticker, fetch_date, data_json)
-               VALUES (?, ?, ?)""",
-            (ticker, today, data_json),
-        )
-        conn.commit()
-    except Exception as exc:
-        log.warning("Failed to cache data for %s: %s", ticker, exc)
-    finally:
-        conn.close()
+    loaded: dict[str, pd.DataFrame] = {}
+    # Stay well below SQLite's bound-parameter limit
+    for start in range(0, len(unseen), 500):
+        chunk = unseen[start : start + 500]
+        placeholders = ",".join("?" * len(chunk))
+        try:
+            rows = conn.execute(
+                f"SELECT ticker, data_blob FROM ohlcv_cache "
+                f"WHERE fetch_date = ? AND ticker IN ({placeholders})",
+                (today, *chunk),
+            ).fetchall()
+        except Exception as exc:
+            log.warning("Failed to read cached data: %s", exc)
+            continue
+        for ticker, blob in rows:
+            try:
+                loaded[ticker] = _deserialize(blob)
+            except Exception:
+                continue
+    _remember(loaded.items(), today)
+    found.update(loaded)
+    return found
+
+
+def save_many(items: Iterable[tuple[str, pd.DataFrame]]) -> None:
+    """Save several OHLCV DataFrames for today in a single transaction."""
+    today = date.today().isoformat()
+    items = list(items)
+    _remember(items, today)
+    rows = [(ticker, today, _serialize(df)) for ticker, df in items]
+    if not rows:
+        return
+    with _write_lock:
+        conn = _get_conn()
+        try:
+            conn.executemany(
+                """INSERT OR REPLACE INTO ohlcv_cache (ticker, fetch_date, data_blob)
+                   VALUES (?, ?, ?)""",
+                rows,
+            )
+            conn.commit()
+        except Exception as exc:
+            conn.rollback()
+            log.warning("Failed to cache data for %d tickers: %s", len(rows), exc)
 
 
 def clear_old_cache(keep_days: int = 3) -> None:
     """Remove cache entries older than keep_days."""
-    from datetime import timedelta
-
     cutoff = (date.today() - timedelta(days=keep_days)).isoformat()
     conn = _get_conn()
     try:
@@ -87,36 +245,62 @@ def clear_old_cache(keep_days: int = 3) -> None:
         conn.execute("DELETE FROM scan_results WHERE scan_date < ?", (cutoff,))
         conn.commit()
     except Exception as exc:
+        conn.rollback()
         log.warning("Failed to clear old cache: %s", exc)
-    finally:
-        conn.close()
 
 
 # ── Scan Results Cache ──
 
-def get_cached_results(scope: int) -> dict | None:
-    """Return cached scan results for today and given scope, or None."""
-    today = date.today().isoformat()
+# scope -> (scanned_at, results) of the latest scan this process saved or
+# read, so repeat dashboard requests skip fetching and decoding the JSON
+_mem_results: dict[str, tuple[str, dict]] = {}
+
+
+def _as_cached(results: dict, scanned_at: str) -> dict:
+    # Shallow copy: callers add top-level flags such as "stale" to what they get
+    return {**results, "scanned_at": scanned_at, "cached": True}
+
+
+def get_cached_results(scope: str, max_age: float | None = None) -> dict | None:
+    """Return cached scan results for today and given scope, or None.
+
+    With ``max_age`` (seconds), the latest scan for the scope is returned
+    instead as long as it is younger than that, even if it ran yesterday.
+
+    The database is always asked which scan is current, since another
+    server process may have saved a newer one; only when that is the scan
+    already held in memory is the JSON fetch and decode skipped.
+    """
+    if max_age is None:
+        where = "scan_date = ? AND scope = ?"
+        params: tuple = (date.today().isoformat(), scope)
+    else:
+        cutoff = (datetime.utcnow() - timedelta(seconds=max_age)).isoformat() + "Z"
+        where = "scope = ? AND scanned_at >= ?"
+        params = (scope, cutoff)
+    latest = f"FROM scan_results WHERE {where} ORDER BY scanned_at DESC LIMIT 1"
+
     conn = _get_conn()
     try:
-        row = conn.execute(
-            "SELECT results_json, scanned_at FROM scan_results "
-            "WHERE scan_date = ? AND scope = ?",
-            (today, scope),
-        ).fetchone()
+        row = conn.execute(f"SELECT scanned_at {latest}", params).fetchone()
+        if row is None:
+            return None
+        entry = _mem_results.get(scope)
+        if entry is not None and entry[0] == row[0]:
+            return _as_cached(entry[1], entry[0])
+
+        row = conn.execute(f"SELECT scanned_at, results_json {latest}", params).fetchone()
         if row is None:
             return None
-        results = json.loads(row[0])
-        results["scanned_at"] = row[1]
-        results["cached"] = True
-        return results
+        scanned_at, results_json = row
+        results = json.loads(results_json)
+        _mem_results[scope] = (scanned_at, results)
+        return _as_cached(results, scanned_at)
     except Exception:
         return None
-    finally:
-        conn.close()
 
 
-def save_scan_results(scope: int, results: dict) -> str:
+def save_scan_results(scope: str, results: dict) -> str:
     """Save scan results to cache. Returns the scanned_at timestamp."""
     today = date.today().isoformat()
     scanned_at = datetime.utcnow().isoformat() + "Z"
@@ -130,7 +314,8 @@ def save_scan_results(scope: int, results: dict) -> str:
         )
         conn.commit()
     except Exception as exc:
+        conn.rollback()
         log.warning("Failed to cache scan results: %s", exc)
-    finally:
-        conn.close()
+    # Copy before the caller decorates its response dict with per-request flags
+    _mem_results[scope] = (scanned_at, dict(results))
     return scanned_at
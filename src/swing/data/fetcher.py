@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import pandas as pd
 import yfinance as yf
+from curl_cffi import requests as curl_requests
 
-from swing.config import HISTORY_PERIOD
-from swing.data.cache import get_cached_data, save_to_cache
+from swing.config import FETCH_WORKERS, HISTORY_PERIOD
+from swing.data.cache import get_cached_data, get_cached_data_many, save_many, save_to_cache
 from swing.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+_OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# Screening is insensitive to ~1e-7 relative error, so OHLCV frames are kept
+# as float32: half the cache size and memory, and fresh downloads match cache
+# hits exactly. Indicator kernels upcast to float64 internally.
+_OHLCV_DTYPES = dict.fromkeys(_OHLCV_COLUMNS, "float32")
+
+# One HTTP session for every yfinance call so TCP/TLS connections are reused
+# across tickers; curl_cffi keeps a separate curl handle per thread.
+_SESSION = curl_requests.Session(impersonate="chrome")
+
 
 def fetch_ohlcv(ticker: str, use_cache: bool = True) -> pd.DataFrame | None:
     """Fetch daily OHLCV data for a single ticker.
@@ -24,29 +38,78 @@ def fetch_ohlcv(ticker: str, use_cache: bool = True) -> pd.DataFrame | None:
         if cached is not None and len(cached) > 50:
             return cached
 
+    df = _download(ticker)
+
+    # Cache the result
+    if df is not None and use_cache and len(df) > 50:
+        save_to_cache(ticker, df)
+
+    return df
+
+
+def _download(ticker: str) -> pd.DataFrame | None:
+    """Download a single ticker's history without touching the cache."""
     try:
-        stock = yf.Ticker(ticker)
+        stock = yf.Ticker(ticker, session=_SESSION)
         df = stock.history(period=HISTORY_PERIOD, interval="1d")
 
         if df is None or df.empty or len(df) < 50:
             log.warning("Insufficient data for %s (%d rows)", ticker, len(df) if df is not None else 0)
             return None
 
-        # Keep only the columns we need
-        df = df[["Open", "High", "Low", "Close", "Volume"]].copy()
-        df.dropna(inplace=True)
-
-        # Cache the result
-        if use_cache and len(df) > 50:
-            save_to_cache(ticker, df)
-
-        return df
+        # Keep only the columns we need, as compact float32
+        return df[_OHLCV_COLUMNS].dropna().astype(_OHLCV_DTYPES)
 
     except Exception as exc:
         log.warning("Failed to fetch data for %s: %s", ticker, exc)
         return None
 
 
+def _download_bulk(tickers: list[str]) -> dict[str, pd.DataFrame | None]:
+    """Download many tickers with a single batched ``yf.download`` call.
+
+    Returns a dict mapping ticker -> DataFrame, or None when the ticker
+    came back with too little data. Tickers yfinance failed to return at
+    all are left out so the caller can retry them individually.
+    """
+    try:
+        bulk = yf.download(
+            tickers,
+            period=HISTORY_PERIOD,
+            interval="1d",
+            group_by="ticker",
+            threads=True,
+            progress=False,
+            auto_adjust=True,
+            session=_SESSION,
+        )
+    except Exception as exc:
+        log.warning("Batched download failed for %d tickers: %s", len(tickers), exc)
+        return {}
+
+    if bulk is None or bulk.empty:
+        return {}
+
+    if not isinstance(bulk.columns, pd.MultiIndex):
+        # Older yfinance returns flat columns for a single ticker
+        bulk = pd.concat({tickers[0]: bulk}, axis=1)
+
+    available = set(bulk.columns.get_level_values(0))
+    frames: dict[str, pd.DataFrame | None] = {}
+    for ticker in tickers:
+        if ticker not in available:
+            continue
+        df = bulk[ticker][_OHLCV_COLUMNS].dropna()
+        if df.empty:
+            continue  # failed download — all-NaN columns
+        if len(df) < 50:
+            log.warning("Insufficient data for %s (%d rows)", ticker, len(df))
+            frames[ticker] = None
+            continue
+        frames[ticker] = df.astype(_OHLCV_DTYPES)
+    return frames
+
+
 def fetch_batch(
     tickers: list[str],
     use_cache: bool = True,
@@ -54,19 +117,59 @@ def fetch_batch(
 ) -> dict[str, pd.DataFrame]:
     """Fetch OHLCV data for a batch of tickers.
 
+    Cache misses are downloaded together with one batched ``yf.download``
+    request; any symbols that batch fails to return are retried one by one
+    on a thread pool. Fresh downloads are written back to the cache in a
+    single transaction at the end. ``progress_callback(i, total, ticker)``
+    is invoked from the calling thread as each ticker completes.
+
     Returns a dict mapping ticker -> DataFrame.
     Skips tickers that fail or have insufficient data.
     """
     results: dict[str, pd.DataFrame] = {}
+    fresh: dict[str, pd.DataFrame] = {}
     total = len(tickers)
+    done = 0
 
-    for i, ticker in enumerate(tickers, 1):
-        df = fetch_ohlcv(ticker, use_cache=use_cache)
-        if df is not None:
+    def _report(ticker: str) -> None:
+        nonlocal done
+        done += 1
+        if progress_callback:
+            progress_callback(done, total, ticker)
+
+    # Serve cache hits first
+    cached = get_cached_data_many(tickers) if use_cache else {}
+    missing: list[str] = []
+    for ticker in tickers:
+        df = cached.get(ticker)
+        if df is not None and len(df) > 50:
             results[ticker] = df
+            _report(ticker)
+        else:
+            missing.append(ticker)
 
-        if progress_callback:
-            progress_callback(i, total, ticker)
+    # One batched request for everything else
+    bulk = _download_bulk(missing) if missing else {}
+    for ticker, df in bulk.items():
+        if df is not None:
+            fresh[ticker] = df
+        _report(ticker)
+
+    # Per-ticker fallback for symbols the batch request dropped
+    failed = [t for t in missing if t not in bulk]
+    if failed:
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(failed))) as executor:
+            futures = {executor.submit(_download, ticker): ticker for ticker in failed}
+            for future in as_completed(futures):
+                ticker = futures[future]
+                df = future.result()
+                if df is not None:
+                    fresh[ticker] = df
+                _report(ticker)
+
+    if use_cache:
+        save_many((t, df) for t, df in fresh.items() if len(df) > 50)
+    results.update(fresh)
 
     log.info("Fetched data for %d / %d tickers", len(results), total)
     return results
@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import csv
-import io
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterable
 from pathlib import Path
 
 import httpx
 
 from swing.config import (
     FALLBACK_CSV,
+    INDEX_LIST_STAMP_DIR,
+    INDEX_LIST_TTL_SECONDS,
     NIFTY100_CSV_URL,
     NIFTY100_FALLBACK_CSV,
     NIFTY200_CSV_URL,
@@ -18,86 +25,153 @@ from swing.config import (
     NIFTY50_CSV_URL,
     NIFTY50_FALLBACK_CSV,
 )
+from swing.data.types import Stock
+from swing.utils.http import make_client
 from swing.utils.logger import get_logger
 
 log = get_logger(__name__)
 
 
-def _download_index_csv(csv_url: str) -> str | None:
-    """Download an index constituent CSV from NSE India."""
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/124.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/csv,text/plain,*/*",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Referer": "https://www.nseindia.com/",
-    }
-
-    # Attempt 1: direct request — works when the CDN doesn't require session cookies
+_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/124.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/csv,text/plain,*/*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Referer": "https://www.nseindia.com/",
+}
+
+_CSV_COLUMNS = ("Symbol", "Company Name", "Industry")
+
+# One keep-alive client for every NSE request: index downloads reuse the
+# TCP/TLS connection, and session cookies persist in its jar across calls.
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared NSE client, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = make_client(_HEADERS, timeout=30)
+    return _client
+
+
+def _download_index_csv(csv_url: str, dest: Path) -> bool:
+    """Stream an index constituent CSV from NSE India into ``dest``.
+
+    The body goes straight to disk instead of being held as one decoded
+    string. Returns False if no attempt produced a CSV.
+    """
+    client = _get_client()
+
+    # Attempt 1: direct request — works when the CDN doesn't require session
+    # cookies, or when the jar still holds cookies from an earlier visit
     try:
-        with httpx.Client(timeout=20, follow_redirects=True) as client:
-            resp = client.get(csv_url, headers=headers)
-            if resp.status_code == 200 and "Symbol" in resp.text:
-                return resp.text
+        with client.stream("GET", csv_url, timeout=20) as resp:
+            if resp.status_code == 200 and _write_csv_body(resp, dest):
+                log.debug("NSE CSV served over %s", resp.http_version)
+                return True
     except Exception as exc:
         log.debug("Direct NSE download failed (%s): %s", csv_url, exc)
 
-    # Attempt 2: establish a session with the NSE homepage first (gets cookies)
+    # Attempt 2: (re)establish a session with the NSE homepage first (gets cookies)
     try:
-        with httpx.Client(timeout=30, follow_redirects=True) as client:
-            try:
-                client.get("https://www.nseindia.com/", headers=headers, timeout=15)
-            except Exception:
-                pass  # non-fatal — proceed without session cookies
-            resp = client.get(csv_url, headers=headers)
+        try:
+            client.get("https://www.nseindia.com/", timeout=15)
+        except Exception:
+            pass  # non-fatal — proceed without session cookies
+        with client.stream("GET", csv_url) as resp:
             resp.raise_for_status()
-            if "Symbol" in resp.text:
-                return resp.text
+            if _write_csv_body(resp, dest):
+                log.debug("NSE CSV served over %s", resp.http_version)
+                return True
     except Exception as exc:
         log.warning("Failed to download CSV from NSE (%s): %s", csv_url, exc)
 
-    return None
+    return False
+
 
+def _write_csv_body(resp: httpx.Response, dest: Path) -> bool:
+    """Write a streamed response to ``dest``; False unless it is an NSE CSV."""
+    with dest.open("wb") as f:
+        for chunk in resp.iter_bytes():
+            f.write(chunk)
+    with dest.open("rb") as f:
+        return b"Symbol" in f.readline()
 
-def _parse_csv_text(csv_text: str) -> list[dict]:
-    """Parse the NSE CSV text into a list of stock dicts."""
-    reader = csv.DictReader(io.StringIO(csv_text))
+
+def _parse_csv_stream(lines: Iterable[str]) -> list[Stock]:
+    """Parse NSE CSV lines (e.g. an open file) into a list of stocks."""
+    # NSE CSV columns: Company Name, Industry, Symbol, Series, ISIN Code
+    reader = csv.reader(lines)
+    try:
+        header = next(reader)
+        i_sym, i_company, i_industry = map(header.index, _CSV_COLUMNS)
+    except (StopIteration, ValueError):
+        log.warning("Could not parse NSE CSV: expected columns %s", list(_CSV_COLUMNS))
+        return []
+
+    width = max(i_sym, i_company, i_industry) + 1
     stocks = []
     for row in reader:
-        # NSE CSV columns: Company Name, Industry, Symbol, Series, ISIN Code
-        symbol = row.get("Symbol", "").strip()
-        company = row.get("Company Name", "").strip()
-        industry = row.get("Industry", "").strip()
+        if len(row) < width:
+            continue  # blank or truncated line
+        symbol = row[i_sym].strip()
         if symbol:
             stocks.append(
-                {
-                    "symbol": symbol,
-                    "company": company,
-                    "industry": industry,
-                    "yf_ticker": f"{symbol}.NS",
-                }
+                Stock(
+                    symbol,
+                    row[i_company].strip(),
+                    sys.intern(row[i_industry].strip()),
+                    f"{symbol}.NS",
+                )
             )
     return stocks
 
 
-def _save_fallback(csv_text: str, fallback_path: Path) -> None:
-    """Save downloaded CSV as fallback."""
-    fallback_path.parent.mkdir(parents=True, exist_ok=True)
-    fallback_path.write_text(csv_text, encoding="utf-8")
-    log.info("Saved fallback CSV at %s", fallback_path)
+def _read_csv_file(path: Path) -> list[Stock]:
+    # utf-8-sig: tolerate a byte-order mark in front of the header row
+    with path.open(encoding="utf-8-sig", newline="") as f:
+        return _parse_csv_stream(f)
 
 
-def _load_fallback(fallback_path: Path) -> list[dict]:
+def _load_fallback(fallback_path: Path) -> list[Stock]:
     """Load stocks from fallback CSV."""
     if not fallback_path.exists():
         log.error("No fallback CSV found at %s", fallback_path)
         return []
     log.info("Loading stocks from fallback CSV: %s", fallback_path.name)
-    csv_text = fallback_path.read_text(encoding="utf-8")
-    return _parse_csv_text(csv_text)
+    return _read_csv_file(fallback_path)
+
+
+# The time of the last successful NSE download is kept in a sidecar file in
+# the writable cache dir. The bundled CSVs' own mtimes only say when the
+# package was checked out or installed, not how old the list is.
+def _stamp_path(fallback_path: Path) -> Path:
+    return INDEX_LIST_STAMP_DIR / f"{fallback_path.stem}.fetched"
+
+
+def _is_fresh(fallback_path: Path) -> bool:
+    """Whether the list was downloaded from NSE within the index-list TTL."""
+    try:
+        fetched_at = float(_stamp_path(fallback_path).read_text())
+    except (OSError, ValueError):
+        return False
+    return time.time() - fetched_at < INDEX_LIST_TTL_SECONDS
+
+
+def _mark_fetched(fallback_path: Path) -> None:
+    """Record that the list was just downloaded from NSE."""
+    stamp = _stamp_path(fallback_path)
+    try:
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.write_text(f"{time.time():.0f}")
+    except OSError as exc:
+        log.warning("Cannot record download time at %s: %s", stamp, exc)
 
 
 def _get_index_stocks(
@@ -105,59 +179,91 @@ def _get_index_stocks(
     csv_url: str,
     fallback_path: Path,
     min_expected_count: int,
-) -> list[dict]:
-    """Return stock universe for an NSE index from live CSV or fallback."""
-    csv_text = _download_index_csv(csv_url)
-    if csv_text:
-        stocks = _parse_csv_text(csv_text)
+    force_refresh: bool = False,
+) -> list[Stock]:
+    """Return stock universe for an NSE index from live CSV or fallback.
+
+    Within INDEX_LIST_TTL_SECONDS of the last successful NSE download the
+    saved fallback CSV is used without contacting NSE at all, unless
+    ``force_refresh`` is set.
+    """
+    if not force_refresh and _is_fresh(fallback_path):
+        stocks = _load_fallback(fallback_path)
         if len(stocks) >= min_expected_count:
-            _save_fallback(csv_text, fallback_path)
-            log.info("Loaded %d stocks for %s from NSE India", len(stocks), name)
             return stocks
-        log.warning(
-            "Downloaded %s CSV had only %d stocks (expected >= %d), using fallback",
-            name,
-            len(stocks),
-            min_expected_count,
+
+    # Download next to the fallback and swap it in only once it has parsed
+    try:
+        fallback_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=fallback_path.parent, prefix=fallback_path.name, suffix=".part"
         )
+    except OSError as exc:
+        log.warning("Cannot write to %s (%s), using fallback", fallback_path.parent, exc)
+        return _load_fallback(fallback_path)
+    os.close(fd)
+    partial = Path(tmp_name)
+
+    try:
+        if _download_index_csv(csv_url, partial):
+            stocks = _read_csv_file(partial)
+            if len(stocks) >= min_expected_count:
+                partial.chmod(0o644)  # mkstemp creates files owner-only
+                partial.replace(fallback_path)
+                _mark_fetched(fallback_path)
+                log.info("Saved fallback CSV at %s", fallback_path)
+                log.info("Loaded %d stocks for %s from NSE India", len(stocks), name)
+                return stocks
+            log.warning(
+                "Downloaded %s CSV had only %d stocks (expected >= %d), using fallback",
+                name,
+                len(stocks),
+                min_expected_count,
+            )
+    finally:
+        partial.unlink(missing_ok=True)
     return _load_fallback(fallback_path)
 
 
-def get_nifty50_stocks() -> list[dict]:
+def get_nifty50_stocks(force_refresh: bool = False) -> list[Stock]:
     """Return Nifty 50 constituents."""
     return _get_index_stocks(
         name="Nifty 50",
         csv_url=NIFTY50_CSV_URL,
         fallback_path=NIFTY50_FALLBACK_CSV,
         min_expected_count=45,
+        force_refresh=force_refresh,
     )
 
 
-def get_nifty100_stocks() -> list[dict]:
+def get_nifty100_stocks(force_refresh: bool = False) -> list[Stock]:
     """Return Nifty 100 constituents."""
     return _get_index_stocks(
         name="Nifty 100",
         csv_url=NIFTY100_CSV_URL,
         fallback_path=NIFTY100_FALLBACK_CSV,
         min_expected_count=90,
+        force_refresh=force_refresh,
     )
 
 
-def get_nifty200_stocks() -> list[dict]:
+def get_nifty200_stocks(force_refresh: bool = False) -> list[Stock]:
     """Return Nifty 200 constituents."""
     return _get_index_stocks(
         name="Nifty 200",
         csv_url=NIFTY200_CSV_URL,
         fallback_path=NIFTY200_FALLBACK_CSV,
         min_expected_count=180,
+        force_refresh=force_refresh,
     )
 
 
-def get_nifty500_stocks() -> list[dict]:
+def get_nifty500_stocks(force_refresh: bool = False) -> list[Stock]:
     """Return Nifty 500 constituents."""
     return _get_index_stocks(
         name="Nifty 500",
         csv_url=NIFTY500_CSV_URL,
         fallback_path=FALLBACK_CSV,
         min_expected_count=400,
+        force_refresh=force_refresh,
     )
@@ -0,0 +1,19 @@
+"""Record types shared across the data layer."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class Stock:
+    """One index constituent.
+
+    Loaders pass ``industry`` through ``sys.intern``: an index has only a few
+    dozen distinct sectors, so every holder shares the same few strings.
+    """
+
+    symbol: str
+    company: str
+    industry: str
+    yf_ticker: str
@@ -0,0 +1,47 @@
+"""Registry of supported markets and their stock-list loaders."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from collections.abc import Iterable
+
+from swing.data.types import Stock
+
+# market -> (module, loader); modules are imported on first use so that
+# checking a market name does not pull in httpx and pandas
+_LOADERS = {
+    "nifty_50": ("swing.data.nifty_indices", "get_nifty50_stocks"),
+    "nifty_100": ("swing.data.nifty_indices", "get_nifty100_stocks"),
+    "nifty_200": ("swing.data.nifty_indices", "get_nifty200_stocks"),
+    "nifty_500": ("swing.data.nifty_indices", "get_nifty500_stocks"),
+    "dow_30": ("swing.data.us_stocks", "get_dow30_stocks"),
+    "nasdaq_100": ("swing.data.us_stocks", "get_nasdaq100_stocks"),
+    "sp_500": ("swing.data.us_stocks", "get_sp500_stocks"),
+}
+
+MARKETS = tuple(_LOADERS)
+US_MARKETS = frozenset({"dow_30", "nasdaq_100", "sp_500"})
+
+
+def get_market_stocks(market: str) -> list[Stock]:
+    """Return the stock list for a market. Raises KeyError for an unknown one."""
+    module, loader = _LOADERS[market]
+    return getattr(importlib.import_module(module), loader)()
+
+
+async def get_all_universes(markets: Iterable[str] | None = None) -> dict[str, list[Stock]]:
+    """Load the stock lists for several markets (default: all) concurrently.
+
+    Each loader runs in a worker thread over its source's shared keep-alive
+    client, so the NSE and Wikipedia requests overlap and the total wait is
+    roughly that of the slowest one. Raises KeyError for an unknown market.
+    """
+    names = list(MARKETS if markets is None else markets)
+    unknown = [name for name in names if name not in _LOADERS]
+    if unknown:
+        raise KeyError(unknown[0])
+    stock_lists = await asyncio.gather(
+        *(asyncio.to_thread(get_market_stocks, name) for name in names)
+    )
+    return dict(zip(names, stock_lists))
@@ -3,13 +3,27 @@
 from __future__ import annotations
 
 import csv
-from io import StringIO
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import astuple
 from pathlib import Path
 
 import httpx
-import pandas as pd
-
-from swing.config import DOW30_FALLBACK_CSV, NASDAQ100_FALLBACK_CSV, SP500_FALLBACK_CSV
+import lxml.html
+
+from swing.config import (
+    DOW30_FALLBACK_CSV,
+    NASDAQ100_FALLBACK_CSV,
+    SP500_FALLBACK_CSV,
+    US_LIST_CACHE_DIR,
+    US_LIST_TTL_SECONDS,
+)
+from swing.data.types import Stock
+from swing.utils.http import make_client
 from swing.utils.logger import get_logger
 
 log = get_logger(__name__)
@@ -24,161 +38,265 @@ _HEADERS = {
 
 _FIELDNAMES = ["symbol", "company", "industry", "yf_ticker"]
 
+# One keep-alive client so the Wikipedia pages share a TCP/TLS connection
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared Wikipedia client, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = make_client(_HEADERS, timeout=15)
+    return _client
+
+
+def _make_stock(symbol: str, company: str, industry: str, yf_ticker: str) -> Stock:
+    return Stock(symbol, company, sys.intern(industry), yf_ticker)
 
-def _save_fallback(stocks: list[dict], fallback_path: Path) -> None:
+
+def _save_fallback(stocks: list[Stock], fallback_path: Path) -> None:
     fallback_path.parent.mkdir(parents=True, exist_ok=True)
     with open(fallback_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=_FIELDNAMES)
-        writer.writeheader()
-        writer.writerows(stocks)
+        writer = csv.writer(f)
+        writer.writerow(_FIELDNAMES)
+        writer.writerows(astuple(stock) for stock in stocks)
     log.info("Saved fallback CSV at %s", fallback_path)
 
 
-def _load_fallback(fallback_path: Path) -> list[dict]:
+def _load_fallback(fallback_path: Path) -> list[Stock]:
     if not fallback_path.exists():
         log.error("No fallback CSV found at %s", fallback_path)
         return []
     log.info("Loading stocks from fallback CSV: %s", fallback_path.name)
     with open(fallback_path, encoding="utf-8") as f:
-        return list(csv.DictReader(f))
+        return [_make_stock(**row) for row in csv.DictReader(f)]
 
 
-def _fetch_wiki_tables(url: str) -> list[pd.DataFrame]:
-    """Fetch HTML from Wikipedia and parse tables."""
-    resp = httpx.get(url, headers=_HEADERS, follow_redirects=True, timeout=15)
-    resp.raise_for_status()
-    return pd.read_html(StringIO(resp.text))
+def _cache_path(url: str) -> Path:
+    return US_LIST_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
 
 
-def _safe_col(df: pd.DataFrame, candidates: list[str]) -> str | None:
-    """Find first matching column name from candidates."""
-    for col in candidates:
-        if col in df.columns:
-            return col
-    return None
+def _read_list_cache(url: str) -> dict | None:
+    """Return the cached entry for a Wikipedia page, or None."""
+    try:
+        entry = json.loads(_cache_path(url).read_text(encoding="utf-8"))
+        entry["stocks"] = [_make_stock(*row) for row in entry["stocks"]]
+        return entry
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
 
 
-def get_sp500_stocks() -> list[dict]:
-    """Get S&P 500 stocks from Wikipedia, falling back to cached CSV."""
+def _write_list_cache(url: str, entry: dict) -> None:
+    path = _cache_path(url)
     try:
-        tables = _fetch_wiki_tables(_WIKI_SP500)
-        df = tables[0]
-
-        sym_col = _safe_col(df, ["Symbol", "Ticker symbol", "Ticker"])
-        name_col = _safe_col(df, ["Security", "Company"])
-        sector_col = _safe_col(df, ["GICS Sector", "Sector", "Industry"])
-
-        if not sym_col or not name_col:
-            log.error("S&P 500 table: unexpected columns: %s", list(df.columns))
-            return _load_fallback(SP500_FALLBACK_CSV)
-
-        stocks = []
-        for _, row in df.iterrows():
-            symbol = str(row[sym_col]).strip().replace(".", "-")
-            stocks.append({
-                "symbol": symbol,
-                "company": str(row[name_col]).strip(),
-                "industry": str(row.get(sector_col, "")).strip() if sector_col else "",
-                "yf_ticker": symbol,
-            })
-
-        if len(stocks) >= 400:
-            _save_fallback(stocks, SP500_FALLBACK_CSV)
-            log.info("Loaded %d S&P 500 stocks from Wikipedia", len(stocks))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stocks = [astuple(stock) for stock in entry["stocks"]]
+        path.write_text(json.dumps({**entry, "stocks": stocks}), encoding="utf-8")
+    except OSError as exc:
+        log.warning("Failed to cache stock list for %s: %s", url, exc)
+
+
+def _fetch_wiki_tables(
+    url: str, extract, min_expected_count: int
+) -> tuple[list[Stock] | None, bool]:
+    """Return ``(stocks, downloaded)`` for what ``extract`` finds in a Wikipedia page.
+
+    Results are cached on disk with the page's ETag / Last-Modified. Within
+    US_LIST_TTL_SECONDS the cached stocks are returned without any request;
+    after that a conditional GET is sent, and a 304 reply reuses them without
+    downloading or parsing the page again; ``downloaded`` is True only when
+    the page itself was fetched and parsed. ``extract`` returns None when
+    the page has no usable table; lists shorter than ``min_expected_count``
+    are returned but not cached.
+    """
+    entry = _read_list_cache(url)
+    if entry and time.time() - entry["fetched_at"] < US_LIST_TTL_SECONDS:
+        return entry["stocks"], False
+
+    headers = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = _get_client().get(url, headers=headers)
+    if resp.status_code == 304 and entry:
+        entry["fetched_at"] = time.time()
+        _write_list_cache(url, entry)
+        return entry["stocks"], False
+    resp.raise_for_status()
+    log.debug("%s served over %s", url, resp.http_version)
+
+    stocks = extract(_wiki_tables(resp.text))
+    if stocks is not None and len(stocks) >= min_expected_count:
+        _write_list_cache(
+            url,
+            {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+                "stocks": stocks,
+            },
+        )
+    return stocks, True
+
+
+# A parsed wikitable: header cell texts, then each body row's cell texts
+_Table = tuple[list[str], list[list[str]]]
+
+
+def _cell_text(cell) -> str:
+    # Whitespace-collapsed text, as pd.read_html renders cells
+    return " ".join(cell.text_content().split())
+
+
+def _wiki_tables(html: str) -> Iterator[_Table]:
+    """Yield the page's wikitables one at a time, as plain cell text.
+
+    Only the <table class="wikitable"> elements are walked, and lazily, so
+    the extractors stop parsing at the first table they can use.
+    """
+    for table in lxml.html.fromstring(html).xpath('//table[contains(@class, "wikitable")]'):
+        rows = table.xpath("./tr | ./thead/tr | ./tbody/tr")
+        if not rows:
+            continue
+        header = [_cell_text(cell) for cell in rows[0].xpath("./th | ./td")]
+        body = [
+            [_cell_text(cell) for cell in row.xpath("./th | ./td")]
+            for row in rows[1:]
+            if row.xpath("./td")
+        ]
+        yield header, body
+
+
+def _safe_col(header: list[str], candidates: list[str]) -> int | None:
+    """Find the index of the first matching column name from candidates."""
+    positions: dict[str, int] = {}
+    for i, name in enumerate(header):
+        positions.setdefault(name, i)  # first of any duplicate headers wins
+    return next((positions[col] for col in candidates if col in positions), None)
+
+
+def _rows_to_stocks(
+    rows: list[list[str]],
+    i_sym: int,
+    i_name: int,
+    i_sector: int | None,
+    dash_symbols: bool = False,
+) -> list[Stock]:
+    """Convert a constituents table's rows into stocks.
+
+    ``dash_symbols`` rewrites share-class dots as Yahoo expects (BRK.B → BRK-B).
+    """
+    width = max(i_sym, i_name, i_sector or 0) + 1
+    stocks = []
+    for row in rows:
+        if len(row) < width:
+            continue  # spanned or malformed row
+        symbol = row[i_sym]
+        if dash_symbols:
+            symbol = symbol.replace(".", "-")
+        industry = row[i_sector] if i_sector is not None else ""
+        stocks.append(_make_stock(symbol, row[i_name], industry, symbol))
+    return stocks
+
+
+def _get_wiki_stocks(
+    name: str,
+    url: str,
+    extract,
+    fallback_path: Path,
+    min_expected_count: int,
+) -> list[Stock]:
+    """Return an index's stocks from Wikipedia, falling back to cached CSV."""
+    try:
+        stocks, downloaded = _fetch_wiki_tables(url, extract, min_expected_count)
+        if stocks is None:
+            return _load_fallback(fallback_path)
+
+        if not downloaded:
+            log.debug("Loaded %d %s stocks from the list cache", len(stocks), name)
+            return stocks
+        if len(stocks) >= min_expected_count:
+            _save_fallback(stocks, fallback_path)
+            log.info("Loaded %d %s stocks from Wikipedia", len(stocks), name)
             return stocks
 
-        log.warning("S&P 500 Wikipedia table returned only %d stocks, using fallback", len(stocks))
+        log.warning("%s Wikipedia table returned only %d stocks, using fallback", name, len(stocks))
     except Exception as exc:
-        log.error("Failed to fetch S&P 500 list: %s", exc)
+        log.error("Failed to fetch %s list: %s", name, exc)
 
-    return _load_fallback(SP500_FALLBACK_CSV)
+    return _load_fallback(fallback_path)
 
 
-def get_dow30_stocks() -> list[dict]:
-    """Get Dow Jones 30 stocks from Wikipedia, falling back to cached CSV."""
-    try:
-        tables = _fetch_wiki_tables(_WIKI_DOW30)
-
-        df = None
-        for table in tables:
-            if "Symbol" in table.columns:
-                df = table
-                break
-
-        if df is None:
-            log.error("Could not find Dow 30 components table")
-            return _load_fallback(DOW30_FALLBACK_CSV)
-
-        sym_col = _safe_col(df, ["Symbol", "Ticker"])
-        name_col = _safe_col(df, ["Company"])
-        sector_col = _safe_col(df, ["Industry", "Sector"])
-
-        if not sym_col or not name_col:
-            log.error("Dow 30 table: unexpected columns: %s", list(df.columns))
-            return _load_fallback(DOW30_FALLBACK_CSV)
-
-        stocks = []
-        for _, row in df.iterrows():
-            symbol = str(row[sym_col]).strip()
-            stocks.append({
-                "symbol": symbol,
-                "company": str(row[name_col]).strip(),
-                "industry": str(row.get(sector_col, "")).strip() if sector_col else "",
-                "yf_ticker": symbol,
-            })
-
-        if len(stocks) >= 25:
-            _save_fallback(stocks, DOW30_FALLBACK_CSV)
-            log.info("Loaded %d Dow Jones stocks from Wikipedia", len(stocks))
-            return stocks
+def _extract_sp500(tables: Iterable[_Table]) -> list[Stock] | None:
+    table = next(iter(tables), None)
+    if table is None:
+        log.error("Could not find S&P 500 components table")
+        return None
+    header, rows = table
 
-        log.warning("Dow 30 Wikipedia table returned only %d stocks, using fallback", len(stocks))
-    except Exception as exc:
-        log.error("Failed to fetch Dow 30 list: %s", exc)
+    i_sym = _safe_col(header, ["Symbol", "Ticker symbol", "Ticker"])
+    i_name = _safe_col(header, ["Security", "Company"])
+    i_sector = _safe_col(header, ["GICS Sector", "Sector", "Industry"])
 
-    return _load_fallback(DOW30_FALLBACK_CSV)
+    if i_sym is None or i_name is None:
+        log.error("S&P 500 table: unexpected columns: %s", header)
+        return None
 
+    return _rows_to_stocks(rows, i_sym, i_name, i_sector, dash_symbols=True)
 
-def get_nasdaq100_stocks() -> list[dict]:
-    """Get Nasdaq 100 stocks from Wikipedia, falling back to cached CSV."""
-    try:
-        tables = _fetch_wiki_tables(_WIKI_NASDAQ100)
-
-        df = None
-        for table in tables:
-            if "Ticker" in table.columns:
-                df = table
-                break
-
-        if df is None:
-            log.error("Could not find Nasdaq 100 components table")
-            return _load_fallback(NASDAQ100_FALLBACK_CSV)
-
-        sym_col = _safe_col(df, ["Ticker", "Symbol"])
-        name_col = _safe_col(df, ["Company", "Security"])
-        sector_col = _safe_col(df, ["GICS Sector", "Sector", "Industry"])
-
-        if not sym_col or not name_col:
-            log.error("Nasdaq 100 table: unexpected columns: %s", list(df.columns))
-            return _load_fallback(NASDAQ100_FALLBACK_CSV)
-
-        stocks = []
-        for _, row in df.iterrows():
-            symbol = str(row[sym_col]).strip()
-            stocks.append({
-                "symbol": symbol,
-                "company": str(row[name_col]).strip(),
-                "industry": str(row.get(sector_col, "")).strip() if sector_col else "",
-                "yf_ticker": symbol,
-            })
-
-        if len(stocks) >= 90:
-            _save_fallback(stocks, NASDAQ100_FALLBACK_CSV)
-            log.info("Loaded %d Nasdaq 100 stocks from Wikipedia", len(stocks))
-            return stocks
 
-        log.warning("Nasdaq 100 Wikipedia table returned only %d stocks, using fallback", len(stocks))
-    except Exception as exc:
-        log.error("Failed to fetch Nasdaq 100 list: %s", exc)
+def _extract_dow30(tables: Iterable[_Table]) -> list[Stock] | None:
+    table = next((t for t in tables if "Symbol" in t[0]), None)
+    if table is None:
+        log.error("Could not find Dow 30 components table")
+        return None
+    header, rows = table
+
+    i_sym = _safe_col(header, ["Symbol", "Ticker"])
+    i_name = _safe_col(header, ["Company"])
+    i_sector = _safe_col(header, ["Industry", "Sector"])
+
+    if i_sym is None or i_name is None:
+        log.error("Dow 30 table: unexpected columns: %s", header)
+        return None
+
+    return _rows_to_stocks(rows, i_sym, i_name, i_sector)
+
+
+def _extract_nasdaq100(tables: Iterable[_Table]) -> list[Stock] | None:
+    table = next((t for t in tables if "Ticker" in t[0]), None)
+    if table is None:
+        log.error("Could not find Nasdaq 100 components table")
+        return None
+    header, rows = table
+
+    i_sym = _safe_col(header, ["Ticker", "Symbol"])
+    i_name = _safe_col(header, ["Company", "Security"])
+    i_sector = _safe_col(header, ["GICS Sector", "Sector", "Industry"])
+
+    if i_sym is None or i_name is None:
+        log.error("Nasdaq 100 table: unexpected columns: %s", header)
+        return None
 
-    return _load_fallback(NASDAQ100_FALLBACK_CSV)
+    return _rows_to_stocks(rows, i_sym, i_name, i_sector)
+
+
+def get_sp500_stocks() -> list[Stock]:
+    """Get S&P 500 stocks from Wikipedia, falling back to cached CSV."""
+    return _get_wiki_stocks("S&P 500", _WIKI_SP500, _extract_sp500, SP500_FALLBACK_CSV, 400)
+
+
+def get_dow30_stocks() -> list[Stock]:
+    """Get Dow Jones 30 stocks from Wikipedia, falling back to cached CSV."""
+    return _get_wiki_stocks("Dow 30", _WIKI_DOW30, _extract_dow30, DOW30_FALLBACK_CSV, 25)
+
+
+def get_nasdaq100_stocks() -> list[Stock]:
+    """Get Nasdaq 100 stocks from Wikipedia, falling back to cached CSV."""
+    return _get_wiki_stocks(
+        "Nasdaq 100", _WIKI_NASDAQ100, _extract_nasdaq100, NASDAQ100_FALLBACK_CSV, 90
+    )
@@ -10,60 +10,51 @@ from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, T
 from rich.table import Table
 from rich.text import Text
 
-from swing.analysis.indicators import compute_indicators
-from swing.analysis.levels import compute_levels
-from swing.analysis.scorer import compute_score, rank_candidates
-from swing.analysis.signals import detect_signals
-from swing.data.cache import clear_old_cache
-from swing.data.fetcher import fetch_ohlcv
 from swing.config import MIN_PRICE, MIN_PRICE_US
-from swing.data.nifty_indices import (
-    get_nifty100_stocks,
-    get_nifty200_stocks,
-    get_nifty50_stocks,
-    get_nifty500_stocks,
-)
-from swing.data.us_stocks import get_dow30_stocks, get_nasdaq100_stocks, get_sp500_stocks
+from swing.data.universes import MARKETS, US_MARKETS, get_market_stocks
 from swing.utils.logger import get_logger
 
 log = get_logger(__name__)
 console = Console()
 
 
+_SIGNAL_ICONS: tuple[tuple[str, str, str], ...] = (
+    ("ema_aligned", "📈", "EMA"),
+    ("rsi_recovery", "📊", "RSI"),
+    ("macd_crossover", "🔀", "MACD"),
+    ("support_bounce", "🔄", "SUP"),
+    ("volume_surge", "📢", "VOL"),
+)
+
+
 def _signal_icons(signals: dict) -> str:
     """Render signal flags as colored icons."""
-    icons = {
-        "ema_aligned": ("📈", "EMA"),
-        "rsi_recovery": ("📊", "RSI"),
-        "macd_crossover": ("🔀", "MACD"),
-        "support_bounce": ("🔄", "SUP"),
-        "volume_surge": ("📢", "VOL"),
-    }
-    parts = []
-    for key, (icon, label) in icons.items():
-        if signals.get(key):
-            parts.append(f"{icon}{label}")
-    return " ".join(parts)
+    return " ".join(f"{icon}{label}" for key, icon, label in _SIGNAL_ICONS if signals.get(key))
+
+
+def _progress() -> Progress:
+    """Progress bar showing the phase and the stock currently being processed."""
+    return Progress(
+        TextColumn("[bold]{task.description}"),
+        TextColumn("[bold blue]{task.fields[ticker]}"),
+        BarColumn(bar_width=40),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console,
+    )
 
 
 def run_screener(market: str = "nifty_500", max_stocks: int | None = None) -> list[dict]:
     """Run the full screener pipeline and return ranked candidates."""
-    market_fetchers = {
-        "nifty_50": get_nifty50_stocks,
-        "nifty_100": get_nifty100_stocks,
-        "nifty_200": get_nifty200_stocks,
-        "nifty_500": get_nifty500_stocks,
-        "dow_30": get_dow30_stocks,
-        "nasdaq_100": get_nasdaq100_stocks,
-        "sp_500": get_sp500_stocks,
-    }
-    
-    us_markets = {"dow_30", "nasdaq_100", "sp_500"}
-
-    fetcher = market_fetchers.get(market)
-    if not fetcher:
+    # Deferred so `swing --help` and `swing --web` skip pandas, NumPy and yfinance
+    from swing.analysis.pipeline import analyze_batch
+    from swing.analysis.scorer import rank_candidates
+    from swing.data.cache import clear_old_cache
+    from swing.data.fetcher import fetch_batch
+
+    if market not in MARKETS:
         console.print(f"[red]❌ Unknown market: {market}[/]")
-        console.print(f"[dim]Available: {', '.join(market_fetchers.keys())}[/]")
+        console.print(f"[dim]Available: {', '.join(MARKETS)}[/]")
         return []
 
     console.print(
@@ -76,7 +67,7 @@ def run_screener(market: str = "nifty_500", max_stocks: int | None = None) -> li
 
     # Step 1: Get stock list
     console.print(f"\n[bold yellow]Step 1:[/] Fetching {market} stock list...")
-    stocks = fetcher()
+    stocks = get_market_stocks(market)
     if not stocks:
         console.print("[red]❌ Could not load stock list. Exiting.[/]")
         return []
@@ -88,79 +79,68 @@ def run_screener(market: str = "nifty_500", max_stocks: int | None = None) -> li
     # Step 2: Clear old cache
     clear_old_cache()
 
-    # Step 3: Scan each stock
-    console.print("[bold yellow]Step 2:[/] Scanning stocks (downloading + analyzing)...\n")
+    # Step 3: Download price history for every stock
+    console.print("[bold yellow]Step 2:[/] Downloading price history...\n")
+    by_ticker = {stock_info.yf_ticker: stock_info for stock_info in stocks}
     candidates: list[dict] = []
     skipped = 0
     filtered = 0
 
-    with Progress(
-        TextColumn("[bold blue]{task.fields[ticker]}"),
-        BarColumn(bar_width=40),
-        MofNCompleteColumn(),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Scanning...", total=len(stocks), ticker="")
+    with _progress() as progress:
+        task = progress.add_task("Downloading", total=len(by_ticker), ticker="")
+        frames = fetch_batch(
+            list(by_ticker),
+            progress_callback=lambda i, total, ticker: progress.update(
+                task, completed=i, ticker=by_ticker[ticker].symbol
+            ),
+        )
 
-        for stock_info in stocks:
-            ticker = stock_info["yf_ticker"]
-            symbol = stock_info["symbol"]
-            progress.update(task, ticker=symbol)
+    # Keep the original stock order so equal scores rank deterministically
+    frames = {ticker: frames[ticker] for ticker in by_ticker if ticker in frames}
+    skipped += len(by_ticker) - len(frames)
+
+    # Step 4: Analyze in parallel worker processes
+    console.print("\n[bold yellow]Step 3:[/] Analyzing stocks...\n")
+    min_price = MIN_PRICE_US if market in US_MARKETS else MIN_PRICE
+
+    with _progress() as progress:
+        task = progress.add_task("Analyzing", total=len(frames), ticker="")
+        analyses = analyze_batch(
+            frames,
+            min_price=min_price,
+            progress_callback=lambda i, total, ticker: progress.update(
+                task, completed=i, ticker=by_ticker[ticker].symbol
+            ),
+        )
+    del frames  # analyses are plain dicts; release the OHLCV frames before building rows
 
-            # Fetch data
-            df = fetch_ohlcv(ticker)
-            if df is None or len(df) < 50:
-                skipped += 1
-                progress.advance(task)
-                continue
-
-            # Compute indicators
-            df = compute_indicators(df)
-
-            # Detect signals
-            min_price = MIN_PRICE_US if market in us_markets else MIN_PRICE
-            result = detect_signals(df, min_price=min_price)
-
-            if not result.get("passed"):
-                if result.get("reason") == "filter_failed":
-                    filtered += 1
-                else:
-                    skipped += 1
-                progress.advance(task)
-                continue
-
-            # Compute levels
-            levels = compute_levels(result)
-            if levels is None:
+    for analysis in analyses:
+        if not analysis["candidate"]:
+            if analysis["reason"] in ("filter_failed", "risk_reward"):
                 filtered += 1
-                progress.advance(task)
-                continue
-
-            # Score
-            score_result = compute_score(result, levels)
-
-            # Build candidate
-            candidates.append(
-                {
-                    "symbol": symbol,
-                    "company": stock_info["company"],
-                    "industry": stock_info["industry"],
-                    "ticker": ticker,
-                    "score": score_result["total"],
-                    "score_breakdown": score_result["factors"],
-                    "signals": result["signals"],
-                    "signal_count": result["signal_count"],
-                    "latest": result["latest"],
-                    "levels": levels,
-                    "supports": result.get("supports", []),
-                    "resistances": result.get("resistances", []),
-                }
-            )
-
-            progress.advance(task)
-
-    # Step 4: Rank
+            else:
+                skipped += 1
+            continue
+
+        stock_info = by_ticker[analysis["ticker"]]
+        candidates.append(
+            {
+                "symbol": stock_info.symbol,
+                "company": stock_info.company,
+                "industry": stock_info.industry,
+                "ticker": analysis["ticker"],
+                "score": analysis["score"],
+                "score_breakdown": analysis["score_breakdown"],
+                "signals": analysis["signals"],
+                "signal_count": analysis["signal_count"],
+                "latest": analysis["latest"],
+                "levels": analysis["levels"],
+                "supports": analysis["supports"],
+                "resistances": analysis["resistances"],
+            }
+        )
+
+    # Step 5: Rank
     candidates = rank_candidates(candidates)
 
     console.print(
@@ -284,10 +264,9 @@ def main():
 
     start = time.time()
     candidates = run_screener(market=args.market, max_stocks=args.max_stocks)
-    
-    us_markets = {"dow_30", "nasdaq_100", "sp_500"}
-    currency = "$" if args.market in us_markets else "₹"
-    
+
+    currency = "$" if args.market in US_MARKETS else "₹"
+
     display_results(candidates, currency=currency)
     elapsed = time.time() - start
     console.print(f"[dim]Completed in {elapsed:.1f}s[/]")
@@ -0,0 +1,23 @@
+"""Shared HTTP client factory for the stock-list fetchers."""
+
+import atexit
+import importlib.util
+
+import httpx
+
+# HTTP/2 lets concurrent requests to one host share a single connection. It
+# needs h2 (pulled in by httpx[http2]); without it clients speak HTTP/1.1.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def make_client(headers: dict[str, str], timeout: float) -> httpx.Client:
+    """Return a keep-alive client that is closed at interpreter exit."""
+    client = httpx.Client(
+        headers=headers,
+        timeout=timeout,
+        follow_redirects=True,
+        http2=_HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=10),
+    )
+    atexit.register(client.close)
+    return client
@@ -1,20 +1,12 @@
 """Logging setup for the swing trading screener."""
 
 import logging
-import sys
 
 
-def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
-    """Return a configured logger."""
-    logger = logging.getLogger(name)
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stderr)
-        handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s │ %(levelname)-7s │ %(name)s │ %(message)s",
-                datefmt="%H:%M:%S",
-            )
-        )
-        logger.addHandler(handler)
-    logger.setLevel(level)
-    return logger
+def get_logger(name: str) -> logging.Logger:
+    """Return the logger for a module.
+
+    Handlers and levels are configured once on the ``swing`` package logger
+    (see ``swing/__init__.py``); module loggers simply propagate to it.
+    """
+    return logging.getLogger(name)
@@ -2,160 +2,397 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path
 
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import BackgroundTasks, FastAPI
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
-from swing.analysis.indicators import compute_indicators
-from swing.analysis.levels import compute_levels
-from swing.analysis.scorer import compute_score, rank_candidates
-from swing.analysis.signals import detect_signals
 from swing.data.cache import (
     clear_old_cache,
     get_cached_results,
     save_scan_results,
 )
-from swing.data.fetcher import fetch_ohlcv
-from swing.config import MIN_PRICE, MIN_PRICE_US, WARMUP_DAYS
-from swing.data.nifty_indices import (
-    get_nifty100_stocks,
-    get_nifty200_stocks,
-    get_nifty50_stocks,
-    get_nifty500_stocks,
+from swing.config import (
+    MIN_PRICE,
+    MIN_PRICE_US,
+    SCAN_FRESH_SECONDS,
+    SCAN_STALE_SECONDS,
+    STOCK_LIST_MEMO_SECONDS,
+    WARMUP_DAYS,
+    WARMUP_MARKETS,
+    WEB_ANALYSIS_WORKERS,
 )
-from swing.data.us_stocks import get_dow30_stocks, get_nasdaq100_stocks, get_sp500_stocks
+from swing.data.types import Stock
+from swing.data.universes import MARKETS, US_MARKETS, get_all_universes, get_market_stocks
 from swing.utils.logger import get_logger
 
 log = get_logger(__name__)
 
-app = FastAPI(title="Swing Trading Screener", version="0.1.0")
+# Scan payloads run to hundreds of candidates; orjson (the "fast" extra)
+# encodes them several times faster than the stdlib json module
+try:
+    import orjson  # noqa: F401 — ORJSONResponse needs it when rendering
+except ImportError:  # pragma: no cover — exercised only without orjson
+    _JSONResponse = JSONResponse
+else:
+    _JSONResponse = ORJSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up scan analysis and start the background preload and warm-up."""
+    # Workers start on the first scan that needs them, not here
+    app.state.analysis_pool = _new_analysis_pool() if WEB_ANALYSIS_WORKERS > 1 else None
+    tasks = [asyncio.create_task(_preload(in_process=app.state.analysis_pool is None))]
+    if WARMUP_MARKETS:
+        tasks.append(asyncio.create_task(_warm_cache(WARMUP_MARKETS)))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        if app.state.analysis_pool is not None:
+            app.state.analysis_pool.shutdown()
+
+
+def _new_analysis_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=WEB_ANALYSIS_WORKERS, initializer=_warm_analysis)
+
+
+def _warm_analysis() -> None:
+    """Load the analysis modules and JIT kernels in this process (also the pool initializer)."""
+    try:
+        from swing.analysis.pipeline import warm_up
+
+        warm_up()
+    except Exception as exc:  # a failing initializer would break the whole pool
+        log.warning("Analysis warm-up failed: %s", exc)
+
+
+async def _preload(in_process: bool) -> None:
+    """Import the scan-path modules in the background.
+
+    The server still starts without pandas and yfinance; this just moves
+    their import ahead of the first scan. When scans are analysed in this
+    process (``in_process``) the analysis warm-up runs here too; pool
+    workers warm up in their initializer instead.
+    """
+    try:
+        await asyncio.gather(
+            asyncio.to_thread(importlib.import_module, "swing.data.fetcher"),
+            asyncio.to_thread(_warm_analysis)
+            if in_process
+            else asyncio.to_thread(importlib.import_module, "swing.analysis.pipeline"),
+        )
+    except Exception as exc:
+        log.warning("Preloading the scan path failed: %s", exc)
+
+
+async def _warm_cache(markets: tuple[str, ...]) -> None:
+    """Scan each market whose cached results are missing or stale, one at a time.
+
+    The stock lists of those markets are loaded together first, so their
+    NSE / Wikipedia requests overlap instead of each waiting on its scan.
+    """
+    for market in markets:
+        if market not in MARKETS:
+            log.warning("Skipping warm-up of unknown market %s", market)
+    pending = [
+        market
+        for market in markets
+        if market in MARKETS
+        and not get_cached_results(_cache_key(market, None), max_age=SCAN_FRESH_SECONDS)
+    ]
+    if not pending:
+        await asyncio.to_thread(clear_old_cache)
+        return
+
+    try:
+        universes = await get_all_universes(pending)
+    except Exception as exc:
+        log.warning("Loading stock lists for warm-up failed: %s", exc)
+    else:
+        loaded_at = time.monotonic()
+        for market, stocks in universes.items():
+            if stocks:
+                _stock_lists[market] = (loaded_at, stocks)
+
+    for market in pending:
+        cache_key = _cache_key(market, None)
+        try:
+            async with _scan_locks.setdefault(cache_key, asyncio.Lock()):
+                if get_cached_results(cache_key, max_age=SCAN_FRESH_SECONDS):
+                    continue
+                await _scan_and_cache(market, None)
+            log.info("Warmed scan cache for %s", market)
+        except Exception as exc:
+            log.warning("Warm-up scan of %s failed: %s", market, exc)
+    await asyncio.to_thread(clear_old_cache)
+
+
+app = FastAPI(
+    title="Swing Trading Screener",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=_JSONResponse,
+)
 
 STATIC_DIR = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
+# The dashboard page is static; read it once rather than on every visit
+_INDEX_HTML = (STATIC_DIR / "index.html").read_text(encoding="utf-8")
+
 
 @app.get("/", response_class=HTMLResponse)
 async def index():
     """Serve the dashboard."""
-    html_path = STATIC_DIR / "index.html"
-    return HTMLResponse(content=html_path.read_text(encoding="utf-8"))
+    return HTMLResponse(content=_INDEX_HTML)
+
+
+# Stale-while-revalidate: a cached scan older than SCAN_FRESH_SECONDS is still
+# served immediately, and at most one background rescan per cache key runs to
+# replace it. Scans older than SCAN_STALE_SECONDS are not served at all.
+_refresh_tasks: dict[str, asyncio.Task] = {}
+
+# Single-flight for uncached scans: concurrent requests for the same cache key
+# queue on its lock, and whoever gets it second finds the first one's result
+_scan_locks: dict[str, asyncio.Lock] = {}
+
+# market -> (monotonic load time, stocks); constituents rarely change, so a
+# loaded list is reused for STOCK_LIST_MEMO_SECONDS instead of re-reading it
+_stock_lists: dict[str, tuple[float, list[Stock]]] = {}
+
+# cache key -> (scanned_at, stale, body) of the cached scan last served, so
+# repeat dashboard loads resend the encoded JSON instead of re-encoding it
+_encoded_scans: dict[str, tuple[str, bool, bytes]] = {}
 
 
 @app.get("/api/results")
 async def results(market: str = "nifty_500", scope: int = 500):
-    """Return cached scan results for today, or null if none exist."""
+    """Return cached scan results, or null if none exist."""
     cache_key = f"{market}_{scope}"
-    cached = get_cached_results(cache_key)
+    cached = get_cached_results(cache_key, max_age=SCAN_STALE_SECONDS)
     if cached:
-        return JSONResponse(cached)
-    return JSONResponse({"cached": False})
+        return _serve_cached(cached, market, scope if scope != 500 else None)
+    return _JSONResponse({"cached": False})
 
 
 @app.get("/api/scan")
-async def scan(market: str = "nifty_500", max_stocks: int | None = None):
-    """Run the screener and return JSON results. Caches results for the day."""
-    scope = max_stocks if max_stocks else 500
+async def scan(
+    background_tasks: BackgroundTasks,
+    market: str = "nifty_500",
+    max_stocks: int | None = None,
+    scope: int | None = None,
+):
+    """Run the screener and return JSON results. Caches results for the day.
+
+    ``scope`` is accepted as an alias of ``max_stocks`` so both endpoints
+    take the same parameter; 500 means the whole market, as for /api/results.
+    """
+    if max_stocks is None and scope != 500:
+        max_stocks = scope
+    if market not in MARKETS:
+        return _JSONResponse({"error": f"Unknown market: {market}"}, status_code=400)
 
     # Check cache first (per market)
-    cache_key = f"{market}_{scope}"
-    cached = get_cached_results(cache_key)
+    cache_key = _cache_key(market, max_stocks)
+    cached = get_cached_results(cache_key, max_age=SCAN_STALE_SECONDS)
     if cached:
-        return JSONResponse(cached)
-
-    market_fetchers = {
-        "nifty_50": get_nifty50_stocks,
-        "nifty_100": get_nifty100_stocks,
-        "nifty_200": get_nifty200_stocks,
-        "nifty_500": get_nifty500_stocks,
-        "dow_30": get_dow30_stocks,
-        "nasdaq_100": get_nasdaq100_stocks,
-        "sp_500": get_sp500_stocks,
-    }
-    
-    us_markets = {"dow_30", "nasdaq_100", "sp_500"}
-
-    fetcher = market_fetchers.get(market)
-    if not fetcher:
-        return JSONResponse({"error": f"Unknown market: {market}"}, status_code=400)
-
-    # No cache — run fresh scan
-    stocks = fetcher()
+        return _serve_cached(cached, market, max_stocks)
+
+    # No cache — run fresh scan, unless another request finished one while we waited
+    async with _scan_locks.setdefault(cache_key, asyncio.Lock()):
+        cached = get_cached_results(cache_key, max_age=SCAN_STALE_SECONDS)
+        if cached:
+            return _serve_cached(cached, market, max_stocks)
+        response_data = await _scan_and_cache(market, max_stocks)
+    if response_data is None:
+        return _JSONResponse({"error": f"Could not load stock list for {market}"}, status_code=500)
+    # Prune old cache rows after the response is sent, not before the scan
+    background_tasks.add_task(clear_old_cache)
+    return _JSONResponse(response_data)
+
+
+def _cache_key(market: str, max_stocks: int | None) -> str:
+    scope = max_stocks if max_stocks else 500
+    return f"{market}_{scope}"
+
+
+def _serve_cached(cached: dict, market: str, max_stocks: int | None) -> Response:
+    """Return a cached scan, kicking off a background refresh if it is stale."""
+    scanned_at = datetime.fromisoformat(cached["scanned_at"].rstrip("Z"))
+    stale = (datetime.utcnow() - scanned_at).total_seconds() > SCAN_FRESH_SECONDS
+    if stale:
+        _schedule_refresh(market, max_stocks)
+
+    cache_key = _cache_key(market, max_stocks)
+    encoded = _encoded_scans.get(cache_key)
+    if encoded is not None and encoded[:2] == (cached["scanned_at"], stale):
+        return Response(content=encoded[2], media_type="application/json")
+
+    cached["stale"] = stale
+    response = _JSONResponse(cached)
+    _encoded_scans[cache_key] = (cached["scanned_at"], stale, response.body)
+    return response
+
+
+def _schedule_refresh(market: str, max_stocks: int | None) -> None:
+    """Start a background rescan unless one is already running for this key."""
+    cache_key = _cache_key(market, max_stocks)
+    running = _refresh_tasks.get(cache_key)
+    if running is not None and not running.done():
+        return
+
+    async def _refresh() -> None:
+        try:
+            # Through the price cache: bars fetched today are reused, and only a
+            # new day's scan downloads the universe again
+            await _scan_and_cache(market, max_stocks)
+            log.info("Refreshed cached scan for %s", cache_key)
+            await asyncio.to_thread(clear_old_cache)
+        except Exception as exc:
+            log.warning("Background refresh of %s failed: %s", cache_key, exc)
+        finally:
+            _refresh_tasks.pop(cache_key, None)
+
+    _refresh_tasks[cache_key] = asyncio.create_task(_refresh())
+
+
+async def _scan_and_cache(
+    market: str,
+    max_stocks: int | None,
+) -> dict | None:
+    """Scan a market, cache the response and return it (None if no stock list).
+
+    Old cache rows are not pruned here; callers do that off the request path.
+    """
+    # Loading the stock list, fetching and analysis all block; keep the event loop responsive
+    loop = asyncio.get_running_loop()
+    stocks = await loop.run_in_executor(None, _load_stocks, market)
     if not stocks:
-        return JSONResponse({"error": f"Could not load stock list for {market}"}, status_code=500)
+        return None
 
     if max_stocks:
         stocks = stocks[:max_stocks]
 
-    clear_old_cache()
+    min_price = MIN_PRICE_US if market in US_MARKETS else MIN_PRICE
+    pool = getattr(app.state, "analysis_pool", None)
+    candidates, stats = await loop.run_in_executor(
+        None, _run_scan, stocks, min_price, pool
+    )
 
-    candidates = []
-    stats = {"total": len(stocks), "scanned": 0, "filtered": 0, "skipped": 0}
+    from swing.analysis.scorer import rank_candidates
 
-    for stock_info in stocks:
-        ticker = stock_info["yf_ticker"]
-        symbol = stock_info["symbol"]
+    candidates = rank_candidates(candidates)
 
-        df = fetch_ohlcv(ticker)
-        if df is None or len(df) < WARMUP_DAYS:
-            stats["skipped"] += 1
-            stats["scanned"] += 1
-            continue
+    # Build response and cache it
+    currency = "$" if market in US_MARKETS else "₹"
+    response_data = {
+        "candidates": candidates,
+        "stats": stats,
+        "count": len(candidates),
+        "market": market,
+        "currency": currency,
+    }
 
-        df = compute_indicators(df)
-        min_price = MIN_PRICE_US if market in us_markets else MIN_PRICE
-        result = detect_signals(df, min_price=min_price)
+    scanned_at = save_scan_results(_cache_key(market, max_stocks), response_data)
+    response_data["scanned_at"] = scanned_at
+    response_data["cached"] = False
+    response_data["stale"] = False
 
-        if not result.get("passed"):
-            stats["filtered"] += 1
-            stats["scanned"] += 1
-            continue
+    return response_data
 
-        levels = compute_levels(result)
-        if levels is None:
-            stats["filtered"] += 1
-            stats["scanned"] += 1
-            continue
 
-        score_result = compute_score(result, levels)
+def _load_stocks(market: str) -> list[Stock]:
+    """Return the market's stock list, reusing one loaded recently."""
+    now = time.monotonic()
+    memo = _stock_lists.get(market)
+    if memo is not None and now - memo[0] < STOCK_LIST_MEMO_SECONDS:
+        return memo[1]
+    stocks = get_market_stocks(market)
+    if stocks:
+        _stock_lists[market] = (now, stocks)
+    return stocks
+
+
+def _run_scan(
+    stocks: list[Stock],
+    min_price: float,
+    pool: Executor | None = None,
+) -> tuple[list[dict], dict]:
+    """Download and analyze every stock, returning (candidates, stats)."""
+    # Imported on first scan so the server starts without pandas, NumPy and yfinance
+    from swing.analysis.pipeline import analyze_batch
+    from swing.data.fetcher import fetch_batch
+
+    by_ticker = {stock_info.yf_ticker: stock_info for stock_info in stocks}
 
-        # Get sparkline data (last 30 closes)
-        sparkline = df["Close"].tail(30).tolist()
+    # Batched downloads over a shared session, then analysis (in the pool if there is one)
+    frames = fetch_batch(list(by_ticker))
+    frames = {ticker: frames[ticker] for ticker in by_ticker if ticker in frames}
+    skipped = len(by_ticker) - len(frames)
+    filtered = 0
 
+    candidates = []
+    try:
+        analyses = analyze_batch(
+            frames, min_price=min_price, min_bars=WARMUP_DAYS, max_workers=1, executor=pool
+        )
+    except BrokenProcessPool as exc:
+        # A worker died (e.g. killed for memory); finish this scan here and
+        # give later scans a fresh pool instead of the broken one
+        log.warning("Analysis pool broke (%s); analysing serially and restarting it", exc)
+        _replace_analysis_pool(pool)
+        analyses = analyze_batch(frames, min_price=min_price, min_bars=WARMUP_DAYS, max_workers=1)
+    del frames  # analyses are plain dicts; release the OHLCV frames before building rows
+    for analysis in analyses:
+        if not analysis["candidate"]:
+            if analysis["reason"] == "insufficient_data":
+                skipped += 1
+            else:
+                filtered += 1
+            continue
+
+        stock_info = by_ticker[analysis["ticker"]]
         candidates.append(
             {
-                "symbol": symbol,
-                "company": stock_info["company"],
-                "industry": stock_info["industry"],
-                "score": score_result["total"],
-                "score_breakdown": score_result["factors"],
-                "signals": result["signals"],
-                "signal_count": result["signal_count"],
-                "latest": result["latest"],
-                "levels": levels,
-                "sparkline": [round(v, 2) for v in sparkline],
+                "symbol": stock_info.symbol,
+                "company": stock_info.company,
+                "industry": stock_info.industry,
+                "score": analysis["score"],
+                "score_breakdown": analysis["score_breakdown"],
+                "signals": analysis["signals"],
+                "signal_count": analysis["signal_count"],
+                "latest": analysis["latest"],
+                "levels": analysis["levels"],
+                "sparkline": analysis["sparkline"],
             }
         )
-        stats["scanned"] += 1
 
-    candidates = rank_candidates(candidates)
+    total = len(stocks)
+    stats = {"total": total, "scanned": total, "filtered": filtered, "skipped": skipped}
+    return candidates, stats
 
-    # Build response and cache it
-    currency = "$" if market in us_markets else "₹"
-    response_data = {
-        "candidates": candidates,
-        "stats": stats,
-        "count": len(candidates),
-        "market": market,
-        "currency": currency,
-    }
 
-    scanned_at = save_scan_results(cache_key, response_data)
-    response_data["scanned_at"] = scanned_at
-    response_data["cached"] = False
+_pool_lock = threading.Lock()
 
-    return JSONResponse(response_data)
+
+def _replace_analysis_pool(broken: Executor) -> None:
+    """Swap a broken analysis pool for a new one, once however many scans hit it."""
+    with _pool_lock:
+        if getattr(app.state, "analysis_pool", None) is broken:
+            app.state.analysis_pool = _new_analysis_pool()
+    broken.shutdown(wait=False)
 
 
 @app.get("/api/health")
@@ -163,10 +400,23 @@ async def health():
     return {"status": "ok"}
 
 
+# Guard against a route being registered twice, e.g. by a duplicated handler
+assert len({route.path for route in app.routes}) == len(app.routes), "duplicate routes"
+
+
 def start_server():
     """Start the uvicorn server."""
     import uvicorn
-    from swing.config import WEB_HOST, WEB_PORT
+    from swing.config import WEB_HOST, WEB_PORT, WEB_WORKERS
 
     print(f"\n🌐 Dashboard starting at http://localhost:{WEB_PORT}\n")
-    uvicorn.run(app, host=WEB_HOST, port=WEB_PORT, log_level="info")
+    # loop/http "auto" already pick uvloop and httptools from uvicorn[standard]
+    # (asyncio on Windows, where uvloop is unavailable). Multiple workers need an
+    # import string so each process can load the app itself.
+    uvicorn.run(
+        "swing.web.app:app" if WEB_WORKERS > 1 else app,
+        host=WEB_HOST,
+        port=WEB_PORT,
+        workers=WEB_WORKERS,
+        log_level="info",
+    )
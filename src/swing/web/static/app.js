@@ -27,7 +27,7 @@ async function loadCachedResults() {
         if (data.cached && data.candidates) {
             displayData(data);
             const statusText = document.getElementById("statusText");
-            statusText.textContent = `${data.count} candidates · scanned at ${formatTime(data.scanned_at)}`;
+            statusText.textContent = `${data.count} candidates · scanned at ${formatTime(data.scanned_at)}${data.stale ? " · refreshing" : ""}`;
         }
     } catch {
         // Silently fail — user can click Scan Now manually
@@ -64,7 +64,7 @@ async function startScan() {
         displayData(data);
 
         if (data.cached) {
-            statusText.textContent = `${data.count} candidates · scanned at ${formatTime(data.scanned_at)}`;
+            statusText.textContent = `${data.count} candidates · scanned at ${formatTime(data.scanned_at)}${data.stale ? " · refreshing" : ""}`;
         } else {
             statusText.textContent = `${data.count} candidates found · scanned at ${formatTime(data.scanned_at)}`;
         }
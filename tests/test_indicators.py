@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from swing.analysis.indicators import compute_indicators
+from swing.config import (
+    ATR_PERIOD,
+    EMA_LONG,
+    EMA_MID,
+    EMA_SHORT,
+    MACD_FAST,
+    MACD_SIGNAL,
+    MACD_SLOW,
+    RSI_PERIOD,
+    VOLUME_SMA_PERIOD,
+)
+
+
+@pytest.fixture(scope="module")
+def ohlcv() -> pd.DataFrame:
+    """A fixed 300-bar random walk, enough to warm up the 200-day EMA."""
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 1.5, 300))
+    high = close + rng.uniform(0.1, 2.0, 300)
+    low = close - rng.uniform(0.1, 2.0, 300)
+    return pd.DataFrame(
+        {
+            "Open": close + rng.normal(0, 0.5, 300),
+            "High": high,
+            "Low": low,
+            "Close": close,
+            "Volume": rng.uniform(1e5, 1e6, 300).round(),
+        },
+        index=pd.date_range("2024-01-01", periods=300, freq="B"),
+    )
+
+
+# ── Reference implementations in plain pandas ──
+
+def _ema(series: pd.Series, window: int) -> pd.Series:
+    return series.ewm(span=window, min_periods=window, adjust=False).mean()
+
+
+def _rsi(close: pd.Series, window: int) -> pd.Series:
+    delta = close.diff()
+    up = delta.clip(lower=0).fillna(0.0)
+    down = (-delta).clip(lower=0).fillna(0.0)
+    avg_up = up.ewm(alpha=1 / window, min_periods=window, adjust=False).mean()
+    avg_down = down.ewm(alpha=1 / window, min_periods=window, adjust=False).mean()
+    return (100 - 100 / (1 + avg_up / avg_down)).where(avg_down != 0, 100.0)
+
+
+def _atr(df: pd.DataFrame, window: int) -> pd.Series:
+    prev_close = df["Close"].shift(1)
+    true_range = pd.concat(
+        [df["High"] - df["Low"], (df["High"] - prev_close).abs(), (df["Low"] - prev_close).abs()],
+        axis=1,
+    ).max(axis=1)
+    atr = pd.Series(np.nan, index=df.index)
+    atr.iloc[window - 1] = true_range.iloc[:window].mean()
+    for i in range(window, len(df)):
+        atr.iloc[i] = (atr.iloc[i - 1] * (window - 1) + true_range.iloc[i]) / window
+    return atr
+
+
+def test_indicators_match_pandas_reference(ohlcv):
+    out = compute_indicators(ohlcv)
+    close = ohlcv["Close"]
+    macd = _ema(close, MACD_FAST) - _ema(close, MACD_SLOW)
+    signal = _ema(macd, MACD_SIGNAL)
+    expected = {
+        "EMA_20": _ema(close, EMA_SHORT),
+        "EMA_50": _ema(close, EMA_MID),
+        "EMA_200": _ema(close, EMA_LONG),
+        "RSI": _rsi(close, RSI_PERIOD),
+        "MACD": macd,
+        "MACD_Signal": signal,
+        "MACD_Hist": macd - signal,
+        "ATR": _atr(ohlcv, ATR_PERIOD),
+        "Volume_SMA": ohlcv["Volume"].rolling(VOLUME_SMA_PERIOD).mean(),
+    }
+    for column, reference in expected.items():
+        np.testing.assert_allclose(
+            out[column].to_numpy(), reference.to_numpy(), rtol=1e-12, atol=1e-9, err_msg=column
+        )
+
+
+def test_input_frame_is_left_unchanged(ohlcv):
+    before = ohlcv.copy()
+    compute_indicators(ohlcv)
+    pd.testing.assert_frame_equal(ohlcv, before)
+
+
+def test_volume_sma_recovers_after_a_missing_bar(ohlcv):
+    volume = ohlcv["Volume"].copy()
+    volume.iloc[[100, 101, 250]] = np.nan
+    out = compute_indicators(ohlcv.assign(Volume=volume))["Volume_SMA"]
+    reference = volume.rolling(VOLUME_SMA_PERIOD).mean()
+    np.testing.assert_allclose(out.to_numpy(), reference.to_numpy(), rtol=1e-12)
+    assert np.isfinite(out.iloc[-1])
+
+
+def test_atr_warm_up_bars_are_nan(ohlcv):
+    # The ta library reported 0.0 here; NaN keeps warm-up bars out of any check
+    atr = compute_indicators(ohlcv)["ATR"]
+    assert atr.iloc[: ATR_PERIOD - 1].isna().all()
+    assert np.isfinite(atr.iloc[ATR_PERIOD - 1 :]).all()
+
+
+def test_indicators_match_ta_library(ohlcv):
+    ta = pytest.importorskip("ta")
+    out = compute_indicators(ohlcv)
+    close = ohlcv["Close"]
+    macd = ta.trend.MACD(close, window_slow=MACD_SLOW, window_fast=MACD_FAST, window_sign=MACD_SIGNAL)
+    expected = {
+        "EMA_20": ta.trend.EMAIndicator(close, window=EMA_SHORT).ema_indicator(),
+        "EMA_200": ta.trend.EMAIndicator(close, window=EMA_LONG).ema_indicator(),
+        "RSI": ta.momentum.RSIIndicator(close, window=RSI_PERIOD).rsi(),
+        "MACD": macd.macd(),
+        "MACD_Signal": macd.macd_signal(),
+        "ATR": ta.volatility.AverageTrueRange(
+            ohlcv["High"], ohlcv["Low"], close, window=ATR_PERIOD
+        ).average_true_range(),
+    }
+    for column, reference in expected.items():
+        ours, theirs = out[column].to_numpy(), reference.to_numpy()
+        if column == "ATR":
+            # Only the warm-up differs: ta fills it with 0.0, we leave NaN
+            assert (theirs[: ATR_PERIOD - 1] == 0).all()
+            ours, theirs = ours[ATR_PERIOD - 1 :], theirs[ATR_PERIOD - 1 :]
+        np.testing.assert_allclose(ours, theirs, rtol=1e-12, atol=1e-9, err_msg=column)
+
+
+# ── Support / resistance ──
+
+def _naive_swing_points(values, window: int, reducer) -> list[float]:
+    return [
+        float(values[i])
+        for i in range(window, len(values) - window)
+        if values[i] == reducer(values[i - window : i + window + 1])
+    ]
+
+
+@pytest.mark.parametrize("reducer", [min, max], ids=["lows", "highs"])
+def test_swing_points_match_per_bar_scan(ohlcv, reducer):
+    from swing.analysis.indicators import _swing_points
+
+    column = "Low" if reducer is min else "High"
+    values = ohlcv[column].to_numpy()
+    np_reducer = np.min if reducer is min else np.max
+    assert _swing_points(values, 5, np_reducer) == _naive_swing_points(values, 5, reducer)
+
+
+def test_swing_points_need_a_full_window():
+    from swing.analysis.indicators import _swing_points
+
+    assert _swing_points(np.arange(10.0), 5, np.min) == []
+
+
+def _naive_cluster(levels: list[float], tolerance: float) -> list[float]:
+    levels = sorted(levels)
+    clusters = [[levels[0]]]
+    for lvl in levels[1:]:
+        if abs(lvl - clusters[-1][-1]) / clusters[-1][-1] <= tolerance:
+            clusters[-1].append(lvl)
+        else:
+            clusters.append([lvl])
+    return [sum(c) / len(c) for c in clusters]
+
+
+def test_cluster_levels_matches_list_clustering():
+    from swing.analysis.indicators import _cluster_levels
+
+    rng = np.random.default_rng(11)
+    levels = rng.uniform(90, 110, 40).tolist()
+    np.testing.assert_allclose(_cluster_levels(levels, 0.015), _naive_cluster(levels, 0.015))
+
+
+def test_cluster_levels_edge_cases():
+    from swing.analysis.indicators import _cluster_levels
+
+    assert _cluster_levels([], 0.015) == []
+    assert _cluster_levels([100.0], 0.015) == [100.0]
+    # Chained within tolerance of the previous level, so one cluster
+    assert _cluster_levels([100.0, 101.0, 102.0], 0.015) == [101.0]
@@ -0,0 +1,50 @@
+import pytest
+
+from swing.config import FALLBACK_CSV, NIFTY50_FALLBACK_CSV
+from swing.data.nifty_indices import _parse_csv_stream, _read_csv_file
+from swing.data.types import Stock
+
+_CSV = (
+    "Company Name,Industry,Symbol,Series,ISIN Code\n"
+    "Reliance Industries Ltd.,Oil Gas & Consumable Fuels,RELIANCE,EQ,INE002A01018\n"
+    "\n"
+    "Truncated Ltd.,Services\n"
+    " Infosys Ltd. , Information Technology , INFY ,EQ,INE009A01021\n"
+    "No Symbol Ltd.,Services,,EQ,INE000000000\n"
+)
+
+
+def test_columns_are_found_by_header_name():
+    reordered = "Symbol,ISIN Code,Industry,Company Name\nTCS,INE467B01029,Information Technology,TCS Ltd.\n"
+    assert _parse_csv_stream(reordered.splitlines()) == [
+        Stock("TCS", "TCS Ltd.", "Information Technology", "TCS.NS")
+    ]
+
+
+def test_blank_truncated_and_symbol_less_rows_are_skipped():
+    assert _parse_csv_stream(_CSV.splitlines()) == [
+        Stock("RELIANCE", "Reliance Industries Ltd.", "Oil Gas & Consumable Fuels", "RELIANCE.NS"),
+        Stock("INFY", "Infosys Ltd.", "Information Technology", "INFY.NS"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "<html><body>Access Denied</body></html>\n", "Company Name,Series\nFoo,EQ\n"],
+    ids=["empty", "html", "missing-columns"],
+)
+def test_unexpected_headers_give_no_stocks(text):
+    assert _parse_csv_stream(text.splitlines()) == []
+
+
+def test_byte_order_mark_is_ignored(tmp_path):
+    path = tmp_path / "nifty.csv"
+    path.write_text(_CSV, encoding="utf-8-sig")
+    assert [s.symbol for s in _read_csv_file(path)] == ["RELIANCE", "INFY"]
+
+
+@pytest.mark.parametrize("path", [NIFTY50_FALLBACK_CSV, FALLBACK_CSV], ids=["nifty50", "nifty500"])
+def test_bundled_fallbacks_parse(path):
+    stocks = _read_csv_file(path)
+    assert stocks
+    assert all(s.symbol and s.yf_ticker == f"{s.symbol}.NS" for s in stocks)
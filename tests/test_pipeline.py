@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from swing.analysis.pipeline import analyze_one
+
+
+def _frame(n: int = 60) -> pd.DataFrame:
+    close = np.linspace(100, 110, n)
+    return pd.DataFrame(
+        {"Open": close, "High": close + 1, "Low": close - 1, "Close": close, "Volume": 1e6}
+    )
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        None,
+        pd.DataFrame(),
+        pd.DataFrame({"Close": []}),
+        _frame().drop(columns="Close"),
+        _frame().assign(Close=lambda d: d["Close"].where(d.index < len(d) - 1)),
+    ],
+    ids=["none", "empty", "no-rows", "no-close", "nan-last-close"],
+)
+def test_malformed_frames_are_rejected_as_insufficient_data(df):
+    result = analyze_one("TEST", df, min_bars=0)
+    assert result == {"ticker": "TEST", "candidate": False, "reason": "insufficient_data"}
+
+
+def test_short_frames_are_rejected_as_insufficient_data():
+    result = analyze_one("TEST", _frame(40), min_bars=50)
+    assert result["reason"] == "insufficient_data"
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from swing.analysis.signals import detect_signals
+
+NAN = np.nan
+
+
+def _frame(spread: list[float], n: int = 60) -> pd.DataFrame:
+    """Indicator-enriched frame that clears every filter; MACD − Signal ends with ``spread``."""
+    close = np.linspace(100, 110, n)
+    macd = np.zeros(n)
+    macd[-len(spread):] = spread
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": 1e6,
+            "EMA_20": close - 2,
+            "EMA_50": close - 4,
+            "EMA_200": close - 10,
+            "RSI": 50.0,
+            "MACD": macd,
+            "MACD_Signal": 0.0,
+            "ATR": 1.0,
+            "Volume_SMA": 1e6,
+        }
+    )
+
+
+def _naive_crossover(macd: np.ndarray, signal: np.ndarray) -> bool:
+    """The original per-bar loop over the last 3 bars."""
+    n = len(macd)
+    for i in range(-3, 0):
+        if abs(i) < n and abs(i) - 1 < n:
+            pair = (macd[i], signal[i], macd[i - 1], signal[i - 1])
+            if not any(np.isnan(v) for v in pair):
+                if macd[i] > signal[i] and macd[i - 1] <= signal[i - 1]:
+                    return True
+    return False
+
+
+@pytest.mark.parametrize(
+    ("spread", "expected"),
+    [
+        ([-1.0, -1.0, -1.0, 1.0], True),  # crossed on the latest bar
+        ([-1.0, 1.0, 2.0, 3.0], True),  # crossed three bars ago
+        ([0.0, 0.5, 0.5, 0.5], True),  # touching counts as below
+        ([-1.0, 1.0, 1.0, 1.0, 1.0], False),  # crossed four bars ago
+        ([1.0, 1.0, 1.0, 1.0], False),  # above throughout
+        ([1.0, -1.0, -1.0, -1.0], False),  # bearish cross
+        ([NAN, 1.0, 1.0, 1.0], False),  # NaN before the cross never counts
+        ([-1.0, NAN, 1.0, 1.0], False),
+    ],
+)
+def test_macd_crossover_cases(spread, expected):
+    result = detect_signals(_frame(spread))
+    assert result["signals"]["macd_crossover"] is expected
+
+
+def test_macd_crossover_matches_naive_loop():
+    rng = np.random.default_rng(13)
+    for _ in range(200):
+        spread = rng.choice([-1.0, 0.0, 1.0, NAN], size=6, p=[0.4, 0.1, 0.4, 0.1])
+        spread[-1] = rng.choice([-1.0, 1.0])  # latest bar must be valid to be checked
+        df = _frame(list(spread))
+        expected = _naive_crossover(df["MACD"].to_numpy(), df["MACD_Signal"].to_numpy())
+        assert detect_signals(df)["signals"]["macd_crossover"] is expected
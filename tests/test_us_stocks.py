@@ -0,0 +1,80 @@
+from swing.data.types import Stock
+from swing.data.us_stocks import (
+    _extract_dow30,
+    _extract_nasdaq100,
+    _extract_sp500,
+    _safe_col,
+    _wiki_tables,
+)
+
+_SP500_PAGE = """
+<html><body>
+<table class="infobox"><tr><th>Not a constituents table</th></tr></table>
+<table class="wikitable sortable" id="constituents">
+  <thead><tr><th>Symbol</th><th>Security</th><th>GICS Sector</th><th>GICS Sector</th></tr></thead>
+  <tbody>
+    <tr><td><a href="#">MMM</a></td><td>3M</td><td>Industrials</td><td>Other</td></tr>
+    <tr><td>BRK.B</td><td>Berkshire
+        Hathaway</td><td>Financials</td><td>Other</td></tr>
+    <tr><td colspan="4">Footnote row</td></tr>
+  </tbody>
+</table>
+<table class="wikitable"><tr><th>Date</th><th>Added</th></tr><tr><td>2024</td><td>X</td></tr></table>
+</body></html>
+"""
+
+_DOW30_PAGE = """
+<table class="wikitable"><tr><th>Year</th><th>Change</th></tr><tr><td>2024</td><td>Y</td></tr></table>
+<table class="wikitable sortable">
+  <tr><th>Company</th><th>Exchange</th><th>Symbol</th><th>Industry</th></tr>
+  <tr><th scope="row">Apple Inc.</th><td>NASDAQ</td><td>AAPL</td><td>Information technology</td></tr>
+  <tr><th scope="row">Visa Inc.</th><td>NYSE</td><td>V</td><td>Financial services</td></tr>
+</table>
+"""
+
+_NASDAQ100_PAGE = """
+<table class="wikitable"><tr><th>Ticker</th><th>Company</th><th>GICS Sector</th></tr>
+  <tr><td>ADBE</td><td>Adobe Inc.</td><td>Information Technology</td></tr>
+</table>
+"""
+
+
+def test_safe_col_prefers_candidate_order_and_first_duplicate():
+    header = ["Ticker", "Security", "GICS Sector", "Symbol", "GICS Sector"]
+    assert _safe_col(header, ["Symbol", "Ticker"]) == 3
+    assert _safe_col(header, ["GICS Sector"]) == 2
+    assert _safe_col(header, ["Company"]) is None
+
+
+def test_wiki_tables_reads_only_wikitables_as_cell_text():
+    tables = list(_wiki_tables(_SP500_PAGE))
+    assert len(tables) == 2
+    header, rows = tables[0]
+    assert header == ["Symbol", "Security", "GICS Sector", "GICS Sector"]
+    assert rows[1] == ["BRK.B", "Berkshire Hathaway", "Financials", "Other"]
+
+
+def test_sp500_uses_first_table_and_dashes_share_classes():
+    assert _extract_sp500(_wiki_tables(_SP500_PAGE)) == [
+        Stock("MMM", "3M", "Industrials", "MMM"),
+        Stock("BRK-B", "Berkshire Hathaway", "Financials", "BRK-B"),
+    ]
+
+
+def test_dow30_finds_the_symbol_table_and_reads_row_headers():
+    assert _extract_dow30(_wiki_tables(_DOW30_PAGE)) == [
+        Stock("AAPL", "Apple Inc.", "Information technology", "AAPL"),
+        Stock("V", "Visa Inc.", "Financial services", "V"),
+    ]
+
+
+def test_nasdaq100_finds_the_ticker_table():
+    assert _extract_nasdaq100(_wiki_tables(_NASDAQ100_PAGE)) == [
+        Stock("ADBE", "Adobe Inc.", "Information Technology", "ADBE"),
+    ]
+
+
+def test_missing_tables_or_columns_give_none():
+    assert _extract_sp500(_wiki_tables("<html><body><p>No tables</p></body></html>")) is None
+    assert _extract_dow30(_wiki_tables(_NASDAQ100_PAGE)) is None
+    assert _extract_sp500(_wiki_tables(_DOW30_PAGE)) is None